@@ -2,12 +2,20 @@
 Arbitrage API Routes
 Price comparison and arbitrage opportunity detection
 """
+import json
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import Settings, get_settings
 from app.core.database import get_db
-from app.schemas import ArbitrageOpportunity
+from app.core.redis import get_redis
+from app.schemas import ArbitrageOpportunity, GPU as GPUSchema
 from app.services.arbitrage_engine import ArbitrageEngine
 
 router = APIRouter()
@@ -17,7 +25,8 @@ router = APIRouter()
 async def get_arbitrage_opportunities(
     min_spread: Optional[float] = Query(None, description="Minimum spread percentage", ge=0, le=100),
     gpu_model: Optional[str] = Query(None, description="Filter by GPU model"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis: Optional[Redis] = Depends(get_redis)
 ):
     """
     Get current arbitrage opportunities
@@ -32,16 +41,26 @@ async def get_arbitrage_opportunities(
     Returns:
         List of arbitrage opportunities sorted by spread percentage
     """
-    engine = ArbitrageEngine(db)
+    engine = ArbitrageEngine(db, redis)
     opportunities = await engine.find_opportunities(
         min_spread_pct=min_spread,
         gpu_model=gpu_model
     )
 
-    return opportunities
+    # Stream one orjson-encoded opportunity at a time instead of building
+    # the full JSON buffer alongside the Python list
+    async def stream():
+        yield b"["
+        for i, opp in enumerate(opportunities):
+            if i:
+                yield b","
+            yield orjson.dumps(opp.model_dump(mode="json"))
+        yield b"]"
+
+    return StreamingResponse(stream(), media_type="application/json")
 
 
-@router.get("/best-deal/{gpu_model}")
+@router.get("/best-deal/{gpu_model}", response_model=GPUSchema)
 async def get_best_deal(
     gpu_model: str,
     min_vram: Optional[int] = Query(None, description="Minimum VRAM in GB"),
@@ -61,53 +80,63 @@ async def get_best_deal(
     best_gpu = await engine.get_best_deal(gpu_model, min_vram)
 
     if not best_gpu:
-        from fastapi import HTTPException, status
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No available GPUs found for {gpu_model}"
         )
 
-    return {
-        "id": str(best_gpu.id),
-        "provider": best_gpu.provider,
-        "model": best_gpu.model,
-        "vram_gb": best_gpu.vram_gb,
-        "price_per_hour": float(best_gpu.price_per_hour),
-        "location": best_gpu.location,
-        "uptime_percent": float(best_gpu.uptime_percent) if best_gpu.uptime_percent else None,
-        "g_score": float(best_gpu.g_score) if best_gpu.g_score else None
-    }
+    return best_gpu
 
 
 @router.get("/compare/{gpu_model}")
 async def compare_providers(
     gpu_model: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis: Optional[Redis] = Depends(get_redis),
+    settings: Settings = Depends(get_settings)
 ):
     """
     Compare prices across all providers for a GPU model
 
+    Results are cached for 30 seconds for performance.
+
     Args:
         gpu_model: GPU model to compare (e.g., "RTX 4090")
 
     Returns:
         Provider statistics with pricing information
     """
+    cache_key = f"arbitrage:compare:{gpu_model}"
+
+    # Serve cached JSON directly, skipping the engine and serialization
+    if redis:
+        cached = await redis.get(cache_key)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+
     engine = ArbitrageEngine(db)
     comparison = await engine.get_provider_comparison(gpu_model)
 
     if not comparison:
-        from fastapi import HTTPException, status
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No data available for {gpu_model}"
         )
 
-    return {
+    payload = {
         "gpu_model": gpu_model,
         "providers": comparison
     }
 
+    if redis:
+        await redis.set(
+            cache_key,
+            json.dumps(jsonable_encoder(payload)),
+            ex=settings.ARBITRAGE_CACHE_TTL
+        )
+
+    return payload
+
 
 @router.get("/savings/{gpu_model}")
 async def calculate_savings(
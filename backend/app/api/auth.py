@@ -2,21 +2,31 @@
 Authentication API Routes
 User signup, login, and profile management
 """
-from datetime import datetime, timedelta
+import asyncio
+from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func, bindparam
 
 from app.core.database import get_db
 from app.core.security import verify_password, get_password_hash, create_access_token
 from app.core.dependencies import get_current_active_user
-from app.core.config import settings
+from app.core.config import Settings, get_settings
 from app.models import User, Wallet
 from app.schemas import UserCreate, UserLogin, User as UserSchema, Token, UserUpdate
 
 router = APIRouter()
 
+# Hot-path statements built once at import time instead of per request
+_USER_BY_EMAIL_STMT = select(User).where(User.email == bindparam("email"))
+_TOUCH_LAST_LOGIN_STMT = (
+    update(User)
+    .where(User.email == bindparam("email"))
+    .values(last_login=func.now())
+    .returning(User.id, User.email, User.password_hash)
+)
+
 
 @router.post("/signup", response_model=UserSchema, status_code=status.HTTP_201_CREATED)
 async def signup(
@@ -36,9 +46,7 @@ async def signup(
         Created user object
     """
     # Check if user already exists
-    result = await db.execute(
-        select(User).where(User.email == user_data.email)
-    )
+    result = await db.execute(_USER_BY_EMAIL_STMT, {"email": user_data.email})
     existing_user = result.scalar_one_or_none()
 
     if existing_user:
@@ -47,8 +55,8 @@ async def signup(
             detail="Email already registered"
         )
 
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    # Create new user (bcrypt is slow by design, keep it off the event loop)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     new_user = User(
         email=user_data.email,
         password_hash=hashed_password
@@ -70,7 +78,8 @@ async def signup(
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    settings: Settings = Depends(get_settings)
 ):
     """
     Login with email and password
@@ -84,22 +93,22 @@ async def login(
     Returns:
         Access token for authenticated requests
     """
-    # Get user by email
-    result = await db.execute(
-        select(User).where(User.email == form_data.username)
-    )
-    user = result.scalar_one_or_none()
-
-    # Verify credentials
-    if not user or not verify_password(form_data.password, user.password_hash):
+    # Touch last_login and fetch credentials in a single round-trip
+    result = await db.execute(_TOUCH_LAST_LOGIN_STMT, {"email": form_data.username})
+    user = result.one_or_none()
+
+    # Verify credentials (bcrypt runs on a worker thread, not the event loop)
+    if not user or not await asyncio.to_thread(
+        verify_password, form_data.password, user.password_hash
+    ):
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Update last login
-    user.last_login = datetime.utcnow()
+    # Persist last_login only for successful logins
     await db.commit()
 
     # Create access token
@@ -115,7 +124,8 @@ async def login(
 @router.post("/login/json", response_model=Token)
 async def login_json(
     credentials: UserLogin,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    settings: Settings = Depends(get_settings)
 ):
     """
     Login with JSON body (alternative to OAuth2 form)
@@ -129,22 +139,22 @@ async def login_json(
     Returns:
         Access token for authenticated requests
     """
-    # Get user by email
-    result = await db.execute(
-        select(User).where(User.email == credentials.email)
-    )
-    user = result.scalar_one_or_none()
-
-    # Verify credentials
-    if not user or not verify_password(credentials.password, user.password_hash):
+    # Touch last_login and fetch credentials in a single round-trip
+    result = await db.execute(_TOUCH_LAST_LOGIN_STMT, {"email": credentials.email})
+    user = result.one_or_none()
+
+    # Verify credentials (bcrypt runs on a worker thread, not the event loop)
+    if not user or not await asyncio.to_thread(
+        verify_password, credentials.password, user.password_hash
+    ):
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Update last login
-    user.last_login = datetime.utcnow()
+    # Persist last_login only for successful logins
     await db.commit()
 
     # Create access token
@@ -2,13 +2,18 @@
 Cluster API Routes
 Multi-GPU cluster management with DPP algorithm
 """
+import json
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.encoders import jsonable_encoder
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import Settings, get_settings
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_user
+from app.core.redis import get_redis
 from app.models import User, ClusterStatus
 from app.schemas import ClusterCreate, Cluster as ClusterSchema
 from app.services.cluster_orchestrator import ClusterOrchestrator
@@ -125,16 +130,8 @@ async def get_cluster_details(
     """
     orchestrator = ClusterOrchestrator(db)
 
-    # Get cluster to check ownership
-    cluster = await orchestrator._get_cluster(cluster_id)
-    if cluster.user_id != current_user.id:
-        from fastapi import HTTPException, status as http_status
-        raise HTTPException(
-            status_code=http_status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this cluster"
-        )
-
-    details = await orchestrator.get_cluster_details(cluster_id)
+    # Ownership is enforced inside the single cluster fetch
+    details = await orchestrator.get_cluster_details(cluster_id, user_id=current_user.id)
     return details
 
 
@@ -230,16 +227,8 @@ async def get_cluster_members(
     """
     orchestrator = ClusterOrchestrator(db)
 
-    # Check ownership
-    cluster = await orchestrator._get_cluster(cluster_id)
-    if cluster.user_id != current_user.id:
-        from fastapi import HTTPException, status as http_status
-        raise HTTPException(
-            status_code=http_status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this cluster"
-        )
-
-    details = await orchestrator.get_cluster_details(cluster_id)
+    # Ownership is enforced inside the single cluster fetch
+    details = await orchestrator.get_cluster_details(cluster_id, user_id=current_user.id)
     return {
         "cluster_id": details['cluster_id'],
         "gpu_count": details['gpu_count'],
@@ -253,12 +242,16 @@ async def simulate_cluster_estimate(
     vram_gb: int = Query(..., description="Minimum VRAM per GPU", ge=1),
     deadline_hours: int = Query(..., description="Time limit in hours", ge=1, le=168),
     gpu_count: Optional[int] = Query(None, description="Preferred GPU count", ge=1, le=10),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis: Optional[Redis] = Depends(get_redis),
+    settings: Settings = Depends(get_settings)
 ):
     """
     Simulate cluster creation to estimate cost (no auth required)
 
     Useful for users to preview cluster pricing before creating.
+    Estimates are cached for 30 seconds, matching the provider sync
+    cadence, so repeated previews don't hit the database.
 
     Query Parameters:
         compute_intensity: Required TFLOPS
@@ -269,27 +262,30 @@ async def simulate_cluster_estimate(
     Returns:
         Estimated cluster configuration and cost
     """
+    cache_key = (
+        f"clusters:estimate:{compute_intensity}:{vram_gb}:"
+        f"{deadline_hours}:{gpu_count}"
+    )
+
+    if redis:
+        cached = await redis.get(cache_key)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+
     orchestrator = ClusterOrchestrator(db)
 
-    # Find eligible GPUs
-    eligible = await orchestrator._find_eligible_gpus(
+    # Find eligible GPUs (already ranked by G-Score in the query)
+    ranked = await orchestrator._find_eligible_gpus(
         min_vram=vram_gb,
         min_g_score=orchestrator.MIN_G_SCORE
     )
 
-    if not eligible:
+    if not ranked:
         return {
             "feasible": False,
             "message": "No eligible GPUs available with specified requirements"
         }
 
-    # Rank GPUs
-    ranked = sorted(
-        eligible,
-        key=lambda g: (g.g_score or 0, g.price_per_hour),
-        reverse=True
-    )
-
     # Select GPUs
     selected, total_tflops = await orchestrator._select_gpus_for_cluster(
         ranked,
@@ -307,19 +303,28 @@ async def simulate_cluster_estimate(
     # Calculate cost
     total_cost = orchestrator._calculate_cluster_cost(selected, deadline_hours)
 
-    return {
+    estimate = {
         "feasible": True,
         "gpu_count": len(selected),
         "estimated_tflops": total_tflops,
-        "total_cost": float(total_cost),
-        "cost_per_hour": float(total_cost / deadline_hours) if deadline_hours > 0 else 0,
+        "total_cost": total_cost,
+        "cost_per_hour": total_cost / deadline_hours if deadline_hours > 0 else 0,
         "gpus": [
             {
                 "model": gpu.model,
                 "provider": gpu.provider,
-                "g_score": float(gpu.g_score) if gpu.g_score else None,
-                "price_per_hour": float(gpu.price_per_hour)
+                "g_score": gpu.g_score,
+                "price_per_hour": gpu.price_per_hour
             }
             for gpu in selected
         ]
     }
+
+    if redis:
+        await redis.set(
+            cache_key,
+            json.dumps(jsonable_encoder(estimate)),
+            ex=settings.ARBITRAGE_CACHE_TTL
+        )
+
+    return estimate
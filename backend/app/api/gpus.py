@@ -2,20 +2,31 @@
 GPU API Routes
 GPU search, filtering, and comparison
 """
+import hashlib
+import json
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_
-from datetime import datetime, timedelta
+from datetime import datetime
 
+from app.core.config import Settings, get_settings
 from app.core.database import get_db
+from app.core.dependencies import freshness_cutoff
+from app.core.redis import get_redis
 from app.models import GPU
 from app.schemas import GPU as GPUSchema, GPUSearch, GPUCompare
 
 router = APIRouter()
 
 
+def _etag(payload: str) -> str:
+    """Short content hash used as the ETag for cached list responses"""
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
 @router.get("/search", response_model=List[GPUSchema])
 async def search_gpus(
     model: Optional[str] = Query(None, description="GPU model filter"),
@@ -25,7 +36,8 @@ async def search_gpus(
     location: Optional[str] = Query(None, description="Location filter"),
     available_only: bool = Query(True, description="Show only available GPUs"),
     limit: int = Query(100, description="Maximum results", le=500),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    cutoff: datetime = Depends(freshness_cutoff)
 ):
     """
     Search for GPUs with filters
@@ -43,9 +55,7 @@ async def search_gpus(
         List of GPUs matching criteria, sorted by price
     """
     # Build query
-    query = select(GPU).where(
-        GPU.last_synced > datetime.utcnow() - timedelta(hours=1)
-    )
+    query = select(GPU).where(GPU.last_synced > cutoff)
 
     # Apply filters
     if model:
@@ -124,37 +134,44 @@ async def compare_gpus(
             detail="Can only compare 2-3 GPUs at once"
         )
 
+    # Reject duplicates up front so the missing-ID check below stays a
+    # simple length comparison against the fetched rows
+    gpu_ids = set(compare_data.gpu_ids)
+    if len(gpu_ids) != len(compare_data.gpu_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Duplicate GPU IDs in comparison"
+        )
+
     # Fetch all GPUs
     result = await db.execute(
-        select(GPU).where(GPU.id.in_(compare_data.gpu_ids))
+        select(GPU).where(GPU.id.in_(gpu_ids))
     )
     gpus = result.scalars().all()
 
-    if len(gpus) != len(compare_data.gpu_ids):
+    if len(gpus) != len(gpu_ids):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="One or more GPUs not found"
         )
 
-    # Build comparison
+    # Compute price stats in a single pass, converting each Decimal once
+    min_price = max_price = None
+    price_sum = 0.0
+    for gpu in gpus:
+        price = float(gpu.price_per_hour)
+        price_sum += price
+        if min_price is None or price < min_price:
+            min_price = price
+        if max_price is None or price > max_price:
+            max_price = price
+
+    # Build comparison (orjson response class handles Decimal/UUID encoding)
     comparison = {
-        "gpus": [
-            {
-                "id": str(gpu.id),
-                "provider": gpu.provider,
-                "model": gpu.model,
-                "vram_gb": gpu.vram_gb,
-                "price_per_hour": float(gpu.price_per_hour),
-                "location": gpu.location,
-                "uptime_percent": float(gpu.uptime_percent) if gpu.uptime_percent else None,
-                "g_score": float(gpu.g_score) if gpu.g_score else None,
-                "available": gpu.available
-            }
-            for gpu in gpus
-        ],
-        "best_price": min(float(gpu.price_per_hour) for gpu in gpus),
-        "price_range": max(float(gpu.price_per_hour) for gpu in gpus) - min(float(gpu.price_per_hour) for gpu in gpus),
-        "avg_price": sum(float(gpu.price_per_hour) for gpu in gpus) / len(gpus)
+        "gpus": [GPUSchema.model_validate(gpu) for gpu in gpus],
+        "best_price": min_price,
+        "price_range": max_price - min_price,
+        "avg_price": price_sum / len(gpus)
     }
 
     return comparison
@@ -162,44 +179,104 @@ async def compare_gpus(
 
 @router.get("/models/available", response_model=List[str])
 async def get_available_models(
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    redis: Optional[Redis] = Depends(get_redis),
+    cutoff: datetime = Depends(freshness_cutoff),
+    settings: Settings = Depends(get_settings)
 ):
     """
     Get list of all available GPU models
 
+    Results are cached for 30 seconds and served with an ETag, so
+    polling clients get 304 Not Modified between sync boundaries.
+
     Returns:
         Unique list of GPU models currently available
     """
+    cache_key = "gpus:models:available"
+
+    if redis:
+        cached = await redis.get(cache_key)
+        if cached:
+            etag = _etag(cached)
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+            return Response(
+                content=cached,
+                media_type="application/json",
+                headers={"ETag": etag}
+            )
+
     result = await db.execute(
         select(GPU.model)
         .where(
             and_(
                 GPU.available == True,
-                GPU.last_synced > datetime.utcnow() - timedelta(hours=1)
+                GPU.last_synced > cutoff
             )
         )
         .distinct()
+        .order_by(GPU.model)
     )
 
-    models = result.scalars().all()
-    return sorted(models)
+    body = json.dumps(list(result.scalars().all()))
+
+    if redis:
+        await redis.set(cache_key, body, ex=settings.ARBITRAGE_CACHE_TTL)
+
+    etag = _etag(body)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/providers/list", response_model=List[str])
 async def get_providers(
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    redis: Optional[Redis] = Depends(get_redis),
+    cutoff: datetime = Depends(freshness_cutoff),
+    settings: Settings = Depends(get_settings)
 ):
     """
     Get list of all GPU providers
 
+    Results are cached for 30 seconds and served with an ETag, so
+    polling clients get 304 Not Modified between sync boundaries.
+
     Returns:
         Unique list of providers
     """
+    cache_key = "gpus:providers:list"
+
+    if redis:
+        cached = await redis.get(cache_key)
+        if cached:
+            etag = _etag(cached)
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+            return Response(
+                content=cached,
+                media_type="application/json",
+                headers={"ETag": etag}
+            )
+
     result = await db.execute(
         select(GPU.provider)
-        .where(GPU.last_synced > datetime.utcnow() - timedelta(hours=1))
+        .where(GPU.last_synced > cutoff)
         .distinct()
+        .order_by(GPU.provider)
     )
 
-    providers = result.scalars().all()
-    return sorted(providers)
+    body = json.dumps(list(result.scalars().all()))
+
+    if redis:
+        await redis.set(cache_key, body, ex=settings.ARBITRAGE_CACHE_TTL)
+
+    etag = _etag(body)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
@@ -2,49 +2,49 @@
 Provider Management API Routes
 Manual sync triggers and status checks
 """
-from fastapi import APIRouter, Depends, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.services.provider_aggregator import ProviderAggregator
+from app.services.worker import sync_all_providers, sync_single_provider
 from app.core.dependencies import get_current_active_user
 from app.models import User
 
 router = APIRouter()
 
+# Providers that can be synced individually
+_VALID_PROVIDERS = frozenset({"Render", "Akash", "io.net", "Vast.ai"})
+_INVALID_PROVIDER_DETAIL = (
+    f"Invalid provider. Must be one of: {', '.join(sorted(_VALID_PROVIDERS))}"
+)
+
 
 @router.post("/sync")
 async def trigger_sync(
-    background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Manually trigger provider synchronization
 
     Requires authentication.
-    Runs sync in background.
+    Enqueues the sync on the Celery worker.
 
     Returns:
-        Confirmation message
+        Confirmation message with task ID
     """
-    async def sync_task():
-        aggregator = ProviderAggregator(db)
-        await aggregator.sync_all_providers()
-
-    background_tasks.add_task(sync_task)
+    task = sync_all_providers.delay()
 
     return {
         "message": "Provider sync triggered",
-        "status": "running_in_background"
+        "status": "queued",
+        "task_id": task.id
     }
 
 
 @router.post("/sync/{provider_name}")
 async def trigger_single_provider_sync(
     provider_name: str,
-    background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -54,26 +54,20 @@ async def trigger_single_provider_sync(
         provider_name: Provider to sync (Render, Akash, io.net, Vast.ai)
 
     Returns:
-        Confirmation message
+        Confirmation message with task ID
     """
-    valid_providers = ['Render', 'Akash', 'io.net', 'Vast.ai']
-
-    if provider_name not in valid_providers:
-        from fastapi import HTTPException, status
+    if provider_name not in _VALID_PROVIDERS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid provider. Must be one of: {', '.join(valid_providers)}"
+            detail=_INVALID_PROVIDER_DETAIL
         )
 
-    async def sync_task():
-        aggregator = ProviderAggregator(db)
-        await aggregator.sync_single_provider(provider_name)
-
-    background_tasks.add_task(sync_task)
+    task = sync_single_provider.delay(provider_name)
 
     return {
         "message": f"{provider_name} sync triggered",
-        "status": "running_in_background"
+        "status": "queued",
+        "task_id": task.id
     }
 
 
@@ -5,7 +5,10 @@ GPU time-block booking system
 from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -19,6 +22,10 @@ from app.services.reservation_service import ReservationService
 
 router = APIRouter()
 
+# Built once at import; validates whole ORM result lists in pydantic-core
+_RESERVATION_LIST_ADAPTER = TypeAdapter(List[ReservationSchema])
+
+
 
 @router.post("/", response_model=ReservationSchema, status_code=201)
 async def create_reservation(
@@ -54,13 +61,15 @@ async def create_reservation(
     return reservation
 
 
-@router.get("/my-bookings", response_model=List[ReservationSchema])
+# response_model=None: rows are validated once through the list
+# adapter, so FastAPI skips its own duplicate validation pass
+@router.get("/my-bookings", response_model=None)
 async def get_my_reservations(
     status: Optional[ReservationStatus] = Query(None, description="Filter by status"),
     upcoming_only: bool = Query(False, description="Show only upcoming reservations"),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
-):
+) -> List[ReservationSchema]:
     """
     Get all reservations for current user
 
@@ -78,7 +87,9 @@ async def get_my_reservations(
         upcoming_only=upcoming_only
     )
 
-    return reservations
+    return _RESERVATION_LIST_ADAPTER.validate_python(
+        reservations, from_attributes=True
+    )
 
 
 @router.get("/{reservation_id}", response_model=ReservationSchema)
@@ -97,15 +108,9 @@ async def get_reservation(
         Reservation details
     """
     service = ReservationService(db)
-    reservation = await service.get_reservation(reservation_id)
-
-    # Only allow owner to view
-    if reservation.user_id != current_user.id:
-        from fastapi import HTTPException, status
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this reservation"
-        )
+    reservation = await service.get_reservation(
+        reservation_id, user_id=current_user.id
+    )
 
     return reservation
 
@@ -235,29 +240,21 @@ async def get_reservation_calendar(
     Returns:
         Calendar with daily availability
     """
-    from datetime import timedelta
-
     service = ReservationService(db)
-    calendar = []
-
-    current_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-
-    for _ in range(days):
-        slots = await service.get_available_slots(
-            gpu_id=gpu_id,
-            date=current_date,
-            slot_duration_hours=1
-        )
-
-        calendar.append({
-            "date": current_date.date().isoformat(),
-            "total_hours_available": len([s for s in slots if s['available']]),
-            "slots": slots
-        })
-
-        current_date += timedelta(days=1)
+    calendar = await service.get_calendar(
+        gpu_id=gpu_id,
+        start_date=start_date,
+        days=days
+    )
 
-    return {
-        "gpu_id": str(gpu_id),
-        "calendar": calendar
-    }
+    # A 30-day calendar is up to 720 slot dicts; stream each day as its
+    # own orjson chunk instead of serializing one large document
+    def render():
+        yield b'{"gpu_id":"' + str(gpu_id).encode() + b'","calendar":['
+        for index, day in enumerate(calendar):
+            if index:
+                yield b","
+            yield orjson.dumps(day)
+        yield b"]}"
+
+    return StreamingResponse(render(), media_type="application/json")
@@ -3,19 +3,30 @@ Provider Health Monitoring API
 Real-time provider status, metrics, and diagnostics
 """
 
-from typing import List, Dict, Any
-from fastapi import APIRouter, HTTPException, Query
+import hashlib
+import json
+from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from redis.asyncio import Redis
 
 from ...core.base_provider import get_provider_registry, ProviderStatus
 from ...core.circuit_breaker import get_circuit_breaker_registry
+from ...core.config import Settings, get_settings
 from ...core.rate_limiter import get_rate_limiter_registry
 from ...core.adaptive_cache import get_adaptive_cache
+from ...core.redis import get_redis
 
 
 router = APIRouter()
 
 
+def _etag(payload: str) -> str:
+    """Short content hash used as the ETag for cached health responses"""
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
 class ProviderHealthResponse(BaseModel):
     """Provider health status response"""
     provider: str
@@ -56,13 +67,34 @@ class CacheStatsResponse(BaseModel):
 
 
 @router.get("/health", response_model=SystemHealthResponse)
-async def get_system_health():
+async def get_system_health(
+    request: Request,
+    redis: Optional[Redis] = Depends(get_redis),
+    settings: Settings = Depends(get_settings),
+):
     """
     Get overall system health status
 
+    Cached briefly in Redis and served with an ETag so dashboard
+    polling gets 304 Not Modified while the status is unchanged.
+
     Returns:
         System-wide health metrics including all providers
     """
+    cache_key = "health:system"
+
+    if redis:
+        cached = await redis.get(cache_key)
+        if cached:
+            etag = _etag(cached)
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304)
+            return Response(
+                content=cached,
+                media_type="application/json",
+                headers={"ETag": etag},
+            )
+
     registry = get_provider_registry()
     providers = registry.get_all()
 
@@ -78,13 +110,16 @@ async def get_system_health():
     unavailable_count = 0
 
     for provider in providers:
-        status = provider.get_status()
+        # get_metrics() already embeds the derived status, so collecting
+        # it once per provider avoids recomputing circuit-breaker state
+        # and rolling stats a second time via get_status()
         metrics = provider.get_metrics()
+        status_value = metrics["status"]
 
         # Count by status
-        if status == ProviderStatus.HEALTHY:
+        if status_value == ProviderStatus.HEALTHY.value:
             healthy_count += 1
-        elif status == ProviderStatus.DEGRADED:
+        elif status_value == ProviderStatus.DEGRADED.value:
             degraded_count += 1
         else:
             unavailable_count += 1
@@ -92,7 +127,7 @@ async def get_system_health():
         provider_health.append(
             ProviderHealthResponse(
                 provider=provider.name,
-                status=status.value,
+                status=status_value,
                 metrics=metrics,
                 circuit_breaker_state=metrics.get("circuit_breaker_state", "unknown"),
                 rate_limiter_available=metrics.get("rate_limiter_tokens", 0),
@@ -108,13 +143,24 @@ async def get_system_health():
     else:
         overall_status = "healthy"
 
-    return SystemHealthResponse(
+    body = SystemHealthResponse(
         healthy_providers=healthy_count,
         total_providers=len(providers),
         degraded_providers=degraded_count,
         unavailable_providers=unavailable_count,
         overall_status=overall_status,
         providers=provider_health,
+    ).model_dump_json()
+
+    if redis:
+        await redis.set(cache_key, body, ex=settings.HEALTH_CACHE_TTL)
+
+    etag = _etag(body)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    return Response(
+        content=body, media_type="application/json", headers={"ETag": etag}
     )
 
 
@@ -138,12 +184,11 @@ async def get_provider_health(provider_name: str):
             detail=f"Provider '{provider_name}' not found"
         )
 
-    status = provider.get_status()
     metrics = provider.get_metrics()
 
     return ProviderHealthResponse(
         provider=provider.name,
-        status=status.value,
+        status=metrics["status"],
         metrics=metrics,
         circuit_breaker_state=metrics.get("circuit_breaker_state", "unknown"),
         rate_limiter_available=metrics.get("rate_limiter_tokens", 0),
@@ -287,17 +332,36 @@ async def reset_all_rate_limiters():
 
 
 @router.get("/cache/stats", response_model=CacheStatsResponse)
-async def get_cache_stats():
+async def get_cache_stats(
+    redis: Optional[Redis] = Depends(get_redis),
+    settings: Settings = Depends(get_settings),
+):
     """
     Get cache statistics
 
+    Cached briefly in Redis to keep dashboard polling cheap.
+
     Returns:
         Cache performance metrics
     """
+    cache_key = "health:cache:stats"
+
+    if redis:
+        cached = await redis.get(cache_key)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+
     cache = await get_adaptive_cache()
     stats = cache.get_stats()
 
-    return CacheStatsResponse(**stats)
+    response = CacheStatsResponse(**stats)
+
+    if redis:
+        await redis.set(
+            cache_key, response.model_dump_json(), ex=settings.HEALTH_CACHE_TTL
+        )
+
+    return response
 
 
 @router.post("/cache/invalidate/{provider_name}")
@@ -327,13 +391,26 @@ async def invalidate_provider_cache(
 
 
 @router.get("/metrics/summary")
-async def get_metrics_summary():
+async def get_metrics_summary(
+    redis: Optional[Redis] = Depends(get_redis),
+    settings: Settings = Depends(get_settings),
+):
     """
     Get comprehensive metrics summary
 
+    Cached briefly in Redis so dashboard polling doesn't re-aggregate
+    every registry on each request.
+
     Returns:
         Aggregated metrics across all systems
     """
+    cache_key = "health:metrics:summary"
+
+    if redis:
+        cached = await redis.get(cache_key)
+        if cached:
+            return Response(content=cached, media_type="application/json")
+
     # Provider metrics
     registry = get_provider_registry()
     provider_metrics = registry.get_all_metrics()
@@ -350,17 +427,20 @@ async def get_metrics_summary():
     cache = await get_adaptive_cache()
     cache_stats = cache.get_stats()
 
-    # Calculate aggregates
-    total_requests = sum(m.get("total_requests", 0) for m in provider_metrics.values())
-    total_successful = sum(m.get("successful_requests", 0) for m in provider_metrics.values())
-    total_failed = sum(m.get("failed_requests", 0) for m in provider_metrics.values())
+    # Calculate aggregates in a single pass instead of four sweeps
+    total_requests = total_successful = total_failed = 0
+    success_rate_sum = 0.0
+    for m in provider_metrics.values():
+        total_requests += m.get("total_requests", 0)
+        total_successful += m.get("successful_requests", 0)
+        total_failed += m.get("failed_requests", 0)
+        success_rate_sum += m.get("success_rate", 0)
 
     avg_success_rate = (
-        sum(m.get("success_rate", 0) for m in provider_metrics.values()) / len(provider_metrics)
-        if provider_metrics else 0
+        success_rate_sum / len(provider_metrics) if provider_metrics else 0
     )
 
-    return {
+    summary = {
         "overview": {
             "total_requests": total_requests,
             "successful_requests": total_successful,
@@ -376,3 +456,12 @@ async def get_metrics_summary():
         "rate_limiters": rl_stats,
         "cache": cache_stats,
     }
+
+    if redis:
+        await redis.set(
+            cache_key,
+            json.dumps(jsonable_encoder(summary)),
+            ex=settings.HEALTH_CACHE_TTL,
+        )
+
+    return summary
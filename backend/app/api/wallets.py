@@ -12,7 +12,8 @@ from typing import List, Optional
 from decimal import Decimal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -22,6 +23,7 @@ from app.services.wallet_service import WalletService, InsufficientFundsError
 from app.schemas import (
     WalletResponse,
     TransactionResponse,
+    TransactionHistoryResponse,
     DepositRequest,
     WithdrawalRequest,
     SpendingAnalyticsResponse
@@ -29,15 +31,25 @@ from app.schemas import (
 
 router = APIRouter()
 
+# Built once at import; validates whole ORM result lists in pydantic-core
+# instead of copying fields one by one in Python
+_TRANSACTION_LIST_ADAPTER = TypeAdapter(List[TransactionResponse])
+
 
 @router.get("/balance", response_model=WalletResponse)
 async def get_wallet_balance(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get current wallet balance and totals
 
+    The balance only changes on deposits/withdrawals, so the response
+    carries an ETag derived from updated_at and polling clients get
+    304 Not Modified in between.
+
     Returns:
         - Current USDC balance
         - Total earned (lifetime)
@@ -46,60 +58,58 @@ async def get_wallet_balance(
     service = WalletService(db)
     wallet = await service.get_wallet(current_user.id)
 
-    return WalletResponse(
-        id=wallet.id,
-        user_id=wallet.user_id,
-        balance_usdc=wallet.balance_usdc,
-        total_earned=wallet.total_earned,
-        total_spent=wallet.total_spent,
-        created_at=wallet.created_at,
-        updated_at=wallet.updated_at
-    )
+    if wallet.updated_at is not None:
+        etag = f'"{wallet.updated_at.timestamp()}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        response.headers["ETag"] = etag
 
+    return WalletResponse.model_validate(wallet)
 
-@router.get("/transactions", response_model=List[TransactionResponse])
+
+# response_model=None: the body is already a validated
+# TransactionHistoryResponse, so FastAPI skips a second validation pass
+@router.get("/transactions", response_model=None)
 async def get_transaction_history(
     limit: int = Query(50, ge=1, le=100, description="Number of transactions to return"),
-    offset: int = Query(0, ge=0, description="Number of transactions to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page"),
     transaction_type: Optional[TransactionType] = Query(None, description="Filter by transaction type"),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
-):
+) -> TransactionHistoryResponse:
     """
     Get transaction history
 
     Query parameters:
         - limit: Number of transactions to return (1-100, default 50)
-        - offset: Pagination offset
+        - cursor: Keyset cursor from the previous page's next_cursor
         - transaction_type: Filter by specific transaction type
 
     Returns:
-        List of transactions ordered by most recent first
+        Page of transactions ordered by most recent first, plus the
+        cursor for the next page (null on the last page)
     """
     service = WalletService(db)
-    transactions = await service.get_transaction_history(
-        user_id=current_user.id,
-        limit=limit,
-        offset=offset,
-        transaction_type=transaction_type
-    )
 
-    return [
-        TransactionResponse(
-            id=t.id,
-            wallet_id=t.wallet_id,
-            type=t.type,
-            amount=t.amount,
-            balance_after=t.balance_after,
-            description=t.description,
-            transaction_hash=t.transaction_hash,
-            reservation_id=t.reservation_id,
-            cluster_id=t.cluster_id,
-            metadata=t.metadata,
-            created_at=t.created_at
+    try:
+        transactions, next_cursor = await service.get_transaction_history(
+            user_id=current_user.id,
+            limit=limit,
+            cursor=cursor,
+            transaction_type=transaction_type
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
-        for t in transactions
-    ]
+
+    return TransactionHistoryResponse(
+        transactions=_TRANSACTION_LIST_ADAPTER.validate_python(
+            transactions, from_attributes=True
+        ),
+        next_cursor=next_cursor
+    )
 
 
 @router.post("/deposit", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
@@ -132,19 +142,7 @@ async def deposit_funds(
             metadata=deposit_data.metadata
         )
 
-        return TransactionResponse(
-            id=transaction.id,
-            wallet_id=transaction.wallet_id,
-            type=transaction.type,
-            amount=transaction.amount,
-            balance_after=transaction.balance_after,
-            description=transaction.description,
-            transaction_hash=transaction.transaction_hash,
-            reservation_id=transaction.reservation_id,
-            cluster_id=transaction.cluster_id,
-            metadata=transaction.metadata,
-            created_at=transaction.created_at
-        )
+        return TransactionResponse.model_validate(transaction)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -186,19 +184,7 @@ async def withdraw_funds(
             metadata=withdrawal_data.metadata
         )
 
-        return TransactionResponse(
-            id=transaction.id,
-            wallet_id=transaction.wallet_id,
-            type=transaction.type,
-            amount=transaction.amount,
-            balance_after=transaction.balance_after,
-            description=transaction.description,
-            transaction_hash=transaction.transaction_hash,
-            reservation_id=transaction.reservation_id,
-            cluster_id=transaction.cluster_id,
-            metadata=transaction.metadata,
-            created_at=transaction.created_at
-        )
+        return TransactionResponse.model_validate(transaction)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -3,13 +3,16 @@ Adaptive Caching System with Redis
 Dynamic TTL based on provider performance and data freshness requirements
 """
 
-import json
+import asyncio
 import logging
 import hashlib
+import time
+from collections import OrderedDict
 from typing import Any, Optional, Callable
 from datetime import datetime, timedelta
 from functools import wraps
 
+import orjson
 import redis.asyncio as redis
 
 from .provider_config import get_provider_config
@@ -34,6 +37,15 @@ class AdaptiveCache:
         self.config = get_provider_config()
         self.redis_client: Optional[redis.Redis] = None
 
+        # Background writer: set() enqueues here and the writer task
+        # flushes batches with one pipeline, so callers never await the
+        # Redis round-trip for cache population
+        self._write_q: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+        # Registered Lua script; see connect()
+        self._get_or_lock = None
+
         # Cache statistics
         self.hits = 0
         self.misses = 0
@@ -44,15 +56,58 @@ class AdaptiveCache:
         self.min_ttl = 10  # Minimum 10 seconds
         self.max_ttl = 300  # Maximum 5 minutes
 
+        # TTL per success-rate decile, precomputed so every cache write
+        # is a table index instead of a comparison ladder
+        self._ttl_table = tuple(
+            self.min_ttl if r < 5
+            else self.base_ttl if r < 7
+            else int(self.base_ttl * 1.5) if r < 9
+            else self.max_ttl
+            for r in range(11)
+        )
+
+        # L1 in-process LRU: serves the hottest queries without a Redis
+        # round-trip. Entries live at most min_ttl so they can never
+        # outlast the shortest Redis TTL by much. Single event loop, so
+        # plain dict mutation needs no locking.
+        self._l1: OrderedDict = OrderedDict()
+        self._l1_maxsize = 2048
+
+        # Keys with a background revalidation in flight, so concurrent
+        # stale hits schedule at most one refresh each
+        self._refreshing: set = set()
+
+        # Per-provider key prefixes, built once instead of re-running
+        # the f-string on every cache operation
+        self._prefixes: dict = {}
+
     async def connect(self):
         """Connect to Redis"""
         try:
-            self.redis_client = await redis.from_url(
+            # A blocking pool lets concurrent handlers issue commands in
+            # parallel instead of serializing on a single connection
+            # Responses stay as bytes: orjson parses them directly, so
+            # decoding every payload to str first was a wasted pass
+            pool = redis.BlockingConnectionPool.from_url(
                 "redis://localhost:6379",
-                encoding="utf-8",
-                decode_responses=True,
+                max_connections=self.config.provider_cache_pool_size,
             )
+            self.redis_client = redis.Redis(connection_pool=pool)
             await self.redis_client.ping()
+            self._write_q = asyncio.Queue(maxsize=1024)
+            self._writer_task = asyncio.create_task(self._writer_loop())
+            # Atomic GET-or-lock: a single EVALSHA either returns the
+            # cached value ({1, value}), claims the recompute lock
+            # ({0}), or reports another holder is already fetching
+            # ({2}). Collapses the miss path's GET + SETNX round-trips
+            # and prevents a fetch stampede on expiry.
+            self._get_or_lock = self.redis_client.register_script(
+                "local v = redis.call('GET', KEYS[1]) "
+                "if v then return {1, v} end "
+                "if redis.call('SET', KEYS[1] .. ':lock', '1', 'NX', 'EX', ARGV[1]) "
+                "then return {0} end "
+                "return {2}"
+            )
             logger.info("Connected to Redis for adaptive caching")
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
@@ -60,6 +115,13 @@ class AdaptiveCache:
 
     async def close(self):
         """Close Redis connection"""
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
         if self.redis_client:
             await self.redis_client.close()
 
@@ -74,9 +136,13 @@ class AdaptiveCache:
         Returns:
             Cache key
         """
-        # Hash query for consistent key length
-        query_hash = hashlib.md5(query.encode()).hexdigest()
-        return f"gp4u:provider:{provider}:{query_hash}"
+        prefix = self._prefixes.get(provider)
+        if prefix is None:
+            prefix = self._prefixes[provider] = f"gp4u:provider:{provider}:"
+
+        # Hash query for consistent key length; keyed blake2b at 8 bytes
+        # is faster than md5 and halves the key footprint in Redis
+        return prefix + hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
 
     def _calculate_dynamic_ttl(self, provider: str, success_rate: float) -> int:
         """
@@ -96,19 +162,31 @@ class AdaptiveCache:
         # 100% success = max TTL
         # 50% success = base TTL
         # 0% success = min TTL
-        if success_rate >= 0.9:
-            ttl = self.max_ttl
-        elif success_rate >= 0.7:
-            ttl = int(self.base_ttl * 1.5)
-        elif success_rate >= 0.5:
-            ttl = self.base_ttl
-        else:
-            ttl = self.min_ttl
+        ttl = self._ttl_table[min(10, max(0, int(success_rate * 10)))]
 
         logger.debug(f"{provider}: Dynamic TTL = {ttl}s (success_rate={success_rate:.2f})")
 
         return ttl
 
+    def _l1_get(self, key: str) -> Optional[Any]:
+        """Look up an unexpired L1 entry, refreshing its LRU position"""
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._l1[key]
+            return None
+        self._l1.move_to_end(key)
+        return value
+
+    def _l1_put(self, key: str, value: Any, ttl: int):
+        """Store an L1 entry, evicting the least recently used on overflow"""
+        self._l1[key] = (value, time.monotonic() + min(ttl, self.min_ttl))
+        self._l1.move_to_end(key)
+        if len(self._l1) > self._l1_maxsize:
+            self._l1.popitem(last=False)
+
     async def get(self, provider: str, query: str) -> Optional[Any]:
         """
         Get cached data
@@ -120,19 +198,27 @@ class AdaptiveCache:
         Returns:
             Cached data or None if miss
         """
+        self.total_requests += 1
+
+        key = self._generate_key(provider, query)
+        l1_value = self._l1_get(key)
+        if l1_value is not None:
+            self.hits += 1
+            logger.debug(f"{provider}: L1 HIT for {query[:50]}")
+            return l1_value
+
         if not self.redis_client:
             return None
 
-        self.total_requests += 1
-
         try:
-            key = self._generate_key(provider, query)
             cached_data = await self.redis_client.get(key)
 
             if cached_data:
                 self.hits += 1
                 logger.debug(f"{provider}: Cache HIT for {query[:50]}")
-                return json.loads(cached_data)
+                value = orjson.loads(cached_data)
+                self._l1_put(key, value, self.min_ttl)
+                return value
             else:
                 self.misses += 1
                 logger.debug(f"{provider}: Cache MISS for {query[:50]}")
@@ -172,22 +258,157 @@ class AdaptiveCache:
             else:
                 ttl = self._calculate_dynamic_ttl(provider, success_rate)
 
-            # Serialize data
-            cached_data = json.dumps({
+            # Serialize data; orjson handles the datetime natively so
+            # there is no isoformat() string build on the hot path.
+            # Entries live in Redis for twice their TTL: past
+            # soft_expires_at they are served stale while a background
+            # refresh runs, and only past 2*ttl are they truly gone.
+            cached_data = orjson.dumps({
                 "data": data,
-                "cached_at": datetime.utcnow().isoformat(),
+                "cached_at": datetime.utcnow(),
                 "provider": provider,
                 "ttl": ttl,
-            })
-
-            # Set with expiration
-            await self.redis_client.setex(key, ttl, cached_data)
+                "soft_expires_at": time.time() + ttl,
+            }, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+
+            # Set with expiration; piggyback the per-provider write
+            # counter on the same round-trip via a pipeline
+            # Round-trip through orjson so L1 hits return the same shape
+            # (string timestamps) as entries read back from Redis.
+            # Populate L1 first so the caller sees its own write even
+            # before the background flush lands.
+            self._l1_put(key, orjson.loads(cached_data), ttl)
+
+            # Cache population doesn't need durability: hand the write
+            # to the background writer and return without a round-trip.
+            # A full queue means Redis is falling behind, so apply
+            # back-pressure by writing through directly.
+            try:
+                self._write_q.put_nowait((provider, key, ttl * 2, cached_data))
+            except (asyncio.QueueFull, AttributeError):
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    pipe.setex(key, ttl * 2, cached_data)
+                    pipe.hincrby(f"gp4u:stats:{provider}", "sets", 1)
+                    await pipe.execute()
 
             logger.debug(f"{provider}: Cached {query[:50]} for {ttl}s")
 
         except Exception as e:
             logger.error(f"Cache set error: {e}")
 
+    async def _writer_loop(self):
+        """Drain queued cache writes and flush them in pipelined batches"""
+        while True:
+            batch = [await self._write_q.get()]
+
+            # Gather up to 64 writes or 5ms worth, whichever comes first
+            deadline = time.monotonic() + 0.005
+            while len(batch) < 64:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._write_q.get(), timeout=remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                set_counts: dict = {}
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for provider, key, expiry, payload in batch:
+                        pipe.setex(key, expiry, payload)
+                        set_counts[provider] = set_counts.get(provider, 0) + 1
+                    for provider, count in set_counts.items():
+                        pipe.hincrby(f"gp4u:stats:{provider}", "sets", count)
+                    await pipe.execute()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Cache writer flush error: {e}")
+
+    async def get_many(self, provider: str, queries: list) -> dict:
+        """
+        Get multiple cached entries in a single round-trip
+
+        Args:
+            provider: Provider name
+            queries: Query identifiers to look up
+
+        Returns:
+            Dict mapping query -> cached data (misses are omitted)
+        """
+        if not self.redis_client or not queries:
+            return {}
+
+        self.total_requests += len(queries)
+
+        try:
+            keys = [self._generate_key(provider, query) for query in queries]
+            values = await self.redis_client.mget(keys)
+
+            results = {}
+            for query, value in zip(queries, values):
+                if value is not None:
+                    self.hits += 1
+                    results[query] = orjson.loads(value)
+                else:
+                    self.misses += 1
+
+            logger.debug(f"{provider}: Bulk get {len(results)}/{len(queries)} hits")
+            return results
+
+        except Exception as e:
+            logger.error(f"Cache get_many error: {e}")
+            return {}
+
+    async def set_many(
+        self,
+        provider: str,
+        entries: dict,
+        success_rate: float = 0.9,
+        custom_ttl: Optional[int] = None,
+    ):
+        """
+        Cache multiple entries with one pipelined round-trip
+
+        Args:
+            provider: Provider name
+            entries: Dict mapping query -> data to cache
+            success_rate: Provider success rate (affects TTL)
+            custom_ttl: Override TTL in seconds
+        """
+        if not self.redis_client or not entries:
+            return
+
+        try:
+            if custom_ttl:
+                ttl = custom_ttl
+            else:
+                ttl = self._calculate_dynamic_ttl(provider, success_rate)
+
+            cached_at = datetime.utcnow()
+            soft_expires_at = time.time() + ttl
+
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for query, data in entries.items():
+                    key = self._generate_key(provider, query)
+                    pipe.setex(key, ttl * 2, orjson.dumps({
+                        "data": data,
+                        "cached_at": cached_at,
+                        "provider": provider,
+                        "ttl": ttl,
+                        "soft_expires_at": soft_expires_at,
+                    }, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z))
+                pipe.hincrby(f"gp4u:stats:{provider}", "sets", len(entries))
+                await pipe.execute()
+
+            logger.debug(f"{provider}: Bulk cached {len(entries)} entries for {ttl}s")
+
+        except Exception as e:
+            logger.error(f"Cache set_many error: {e}")
+
     async def invalidate(self, provider: str, query: Optional[str] = None):
         """
         Invalidate cache
@@ -203,15 +424,35 @@ class AdaptiveCache:
             if query:
                 # Invalidate specific key
                 key = self._generate_key(provider, query)
-                await self.redis_client.delete(key)
+                self._l1.pop(key, None)
+                await self.redis_client.unlink(key)
                 logger.info(f"{provider}: Invalidated cache for {query[:50]}")
             else:
-                # Invalidate all keys for provider
-                pattern = f"gp4u:provider:{provider}:*"
-                keys = await self.redis_client.keys(pattern)
-                if keys:
-                    await self.redis_client.delete(*keys)
-                    logger.info(f"{provider}: Invalidated {len(keys)} cache entries")
+                # Invalidate all keys for provider. SCAN keeps the Redis
+                # server responsive (KEYS blocks on large keyspaces) and
+                # UNLINK reclaims memory off the event loop; batching
+                # through a pipeline amortizes round-trips.
+                prefix = f"gp4u:provider:{provider}:"
+                for l1_key in [k for k in self._l1 if k.startswith(prefix)]:
+                    del self._l1[l1_key]
+                pattern = f"{prefix}*"
+                invalidated = 0
+                batch = []
+                async for key in self.redis_client.scan_iter(match=pattern, count=500):
+                    batch.append(key)
+                    if len(batch) >= 500:
+                        async with self.redis_client.pipeline(transaction=False) as pipe:
+                            pipe.unlink(*batch)
+                            await pipe.execute()
+                        invalidated += len(batch)
+                        batch = []
+                if batch:
+                    async with self.redis_client.pipeline(transaction=False) as pipe:
+                        pipe.unlink(*batch)
+                        await pipe.execute()
+                    invalidated += len(batch)
+                if invalidated:
+                    logger.info(f"{provider}: Invalidated {invalidated} cache entries")
 
         except Exception as e:
             logger.error(f"Cache invalidate error: {e}")
@@ -228,8 +469,10 @@ class AdaptiveCache:
 
         Implements stale-while-revalidate pattern:
         1. Check cache
-        2. If hit, return immediately
-        3. If miss, fetch and cache
+        2. If fresh, return immediately
+        3. If stale (past soft expiry, still within the hard TTL),
+           return the stale value and refresh in the background
+        4. Only if the entry is truly gone, fetch synchronously
 
         Args:
             provider: Provider name
@@ -243,9 +486,37 @@ class AdaptiveCache:
         # Try cache first
         cached_data = await self.get(provider, query)
         if cached_data:
+            soft_expires_at = cached_data.get("soft_expires_at")
+            if soft_expires_at and time.time() > soft_expires_at:
+                key = self._generate_key(provider, query)
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    asyncio.create_task(
+                        self._refresh(key, provider, query, fetch_func, success_rate)
+                    )
             return cached_data["data"]
 
-        # Cache miss - fetch fresh data
+        # Cache miss: claim the recompute lock, or wait briefly for the
+        # worker that already holds it to publish the value
+        key = self._generate_key(provider, query)
+        holds_lock = False
+        if self._get_or_lock is not None:
+            try:
+                for _ in range(40):
+                    outcome = await self._get_or_lock(keys=[key], args=[10])
+                    if outcome[0] == 1:
+                        value = orjson.loads(outcome[1])
+                        self._l1_put(key, value, self.min_ttl)
+                        return value["data"]
+                    if outcome[0] == 0:
+                        holds_lock = True
+                        break
+                    await asyncio.sleep(0.05)
+                # If the holder never published, fall through and fetch
+            except Exception as e:
+                logger.error(f"Cache lock error: {e}")
+
+        # Fetch fresh data
         try:
             fresh_data = await fetch_func()
 
@@ -257,6 +528,32 @@ class AdaptiveCache:
         except Exception as e:
             logger.error(f"Fetch function failed: {e}")
             raise
+        finally:
+            if holds_lock:
+                try:
+                    await self.redis_client.unlink(key + ":lock")
+                except Exception:
+                    pass
+
+    async def _refresh(
+        self,
+        key: str,
+        provider: str,
+        query: str,
+        fetch_func: Callable,
+        success_rate: float,
+    ):
+        """Background revalidation of a stale entry"""
+        try:
+            fresh_data = await fetch_func()
+            await self.set(provider, query, fresh_data, success_rate)
+            logger.debug(f"{provider}: Revalidated {query[:50]}")
+        except Exception as e:
+            # The stale entry keeps serving until its hard TTL; the next
+            # stale hit will schedule another attempt
+            logger.error(f"Background refresh failed for {provider}: {e}")
+        finally:
+            self._refreshing.discard(key)
 
     def get_stats(self) -> dict:
         """Get cache statistics"""
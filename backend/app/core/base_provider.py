@@ -4,11 +4,13 @@ Abstract base class for all GPU provider integrations
 with retry logic, circuit breaker, rate limiting, and metrics
 """
 
+import asyncio
 import time
 import logging
 import random
+from time import time as _now
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Type
+from typing import List, Dict, Any, Optional, Tuple, Type
 from datetime import datetime
 from enum import Enum
 
@@ -29,6 +31,57 @@ from .provider_config import get_provider_config
 logger = logging.getLogger(__name__)
 
 
+# Shared HTTP/2 transport: each provider keeps its own AsyncClient for
+# auth headers and timeouts, but they all multiplex one connection pool
+# so TLS handshakes and sockets aren't duplicated four ways
+_shared_transport: Optional[httpx.AsyncHTTPTransport] = None
+
+
+def _get_shared_transport() -> httpx.AsyncHTTPTransport:
+    """Get the shared HTTP transport, creating it on first use"""
+    global _shared_transport
+    if _shared_transport is None:
+        _shared_transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=128,
+                max_keepalive_connections=64,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _shared_transport
+
+
+async def close_shared_transport():
+    """Tear down the shared transport; called once at shutdown"""
+    global _shared_transport
+    if _shared_transport is not None:
+        await _shared_transport.aclose()
+        _shared_transport = None
+
+
+# (timeout, max_retries, rate_limit) per provider, resolved lazily from
+# config on first use so instance construction skips the getattr +
+# f-string lookups
+_PROVIDER_SETTINGS: Optional[Dict[str, Tuple[int, int, int]]] = None
+
+
+def _get_provider_settings(name: str) -> Tuple[int, int, int]:
+    """Get the (timeout, max_retries, rate_limit) tuple for a provider"""
+    global _PROVIDER_SETTINGS
+    if _PROVIDER_SETTINGS is None:
+        config = get_provider_config()
+        _PROVIDER_SETTINGS = {
+            provider: (
+                getattr(config, f"{provider}_timeout", 30),
+                getattr(config, f"{provider}_max_retries", 3),
+                getattr(config, f"{provider}_rate_limit", 100),
+            )
+            for provider in ("vastai", "akash", "render", "ionet")
+        }
+    return _PROVIDER_SETTINGS.get(name, (30, 3, 100))
+
+
 class ProviderStatus(Enum):
     """Provider health status"""
     HEALTHY = "healthy"
@@ -39,6 +92,23 @@ class ProviderStatus(Enum):
 class ProviderMetrics:
     """Track provider performance metrics"""
 
+    # Fixed layout: record_request runs once per provider request, and
+    # slotted attribute access skips the per-instance dict
+    __slots__ = (
+        "provider_name",
+        "total_requests",
+        "successful_requests",
+        "failed_requests",
+        "total_response_time",
+        "slow_requests",
+        "circuit_breaker_trips",
+        "rate_limit_hits",
+        "last_request_time",
+        "first_request_time",
+        "_stats_cached",
+        "_stats_cached_at",
+    )
+
     def __init__(self, provider_name: str):
         self.provider_name = provider_name
         self.total_requests = 0
@@ -51,13 +121,19 @@ class ProviderMetrics:
         self.last_request_time: Optional[float] = None
         self.first_request_time: Optional[float] = None
 
+        # Short-lived snapshot so get_status()/metrics polling don't
+        # redo the averaging math on every call
+        self._stats_cached: Optional[Dict[str, Any]] = None
+        self._stats_cached_at: float = 0.0
+
     def record_request(self, duration: float, success: bool, slow_threshold: float = 5.0):
         """Record a request"""
+        t = _now()
         if self.first_request_time is None:
-            self.first_request_time = time.time()
+            self.first_request_time = t
 
         self.total_requests += 1
-        self.last_request_time = time.time()
+        self.last_request_time = t
         self.total_response_time += duration
 
         if success:
@@ -68,16 +144,30 @@ class ProviderMetrics:
         if duration > slow_threshold:
             self.slow_requests += 1
 
+        self._stats_cached = None
+
     def record_circuit_breaker_trip(self):
         """Record circuit breaker opening"""
         self.circuit_breaker_trips += 1
+        self._stats_cached = None
 
     def record_rate_limit_hit(self):
         """Record rate limit exceeded"""
         self.rate_limit_hits += 1
+        self._stats_cached = None
 
     def get_stats(self) -> Dict[str, Any]:
-        """Get metrics as dictionary"""
+        """
+        Get metrics as dictionary
+
+        Returns a snapshot reused for up to 250ms and invalidated on
+        every record_* call. last_request_time is the raw epoch float;
+        BaseProvider.get_metrics formats it for serialization.
+        """
+        now = _now()
+        if self._stats_cached is not None and now - self._stats_cached_at < 0.25:
+            return self._stats_cached
+
         avg_response_time = (
             self.total_response_time / self.total_requests
             if self.total_requests > 0
@@ -91,12 +181,12 @@ class ProviderMetrics:
         )
 
         uptime = (
-            time.time() - self.first_request_time
+            now - self.first_request_time
             if self.first_request_time
             else 0
         )
 
-        return {
+        stats = {
             "provider": self.provider_name,
             "total_requests": self.total_requests,
             "successful_requests": self.successful_requests,
@@ -107,12 +197,11 @@ class ProviderMetrics:
             "circuit_breaker_trips": self.circuit_breaker_trips,
             "rate_limit_hits": self.rate_limit_hits,
             "uptime_seconds": round(uptime, 2),
-            "last_request_time": (
-                datetime.fromtimestamp(self.last_request_time).isoformat()
-                if self.last_request_time
-                else None
-            ),
+            "last_request_time": self.last_request_time,
         }
+        self._stats_cached = stats
+        self._stats_cached_at = now
+        return stats
 
 
 class BaseProvider(ABC):
@@ -128,20 +217,20 @@ class BaseProvider(ABC):
     - Error handling
     """
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, client: Optional[httpx.AsyncClient] = None):
         """
         Initialize provider
 
         Args:
             name: Provider name (vastai, akash, render, ionet)
+            client: Optional HTTP client to use; defaults to one built
+                on the shared HTTP/2 transport
         """
         self.name = name
         self.config = get_provider_config()
 
         # Get provider-specific configuration
-        self.timeout = getattr(self.config, f"{name}_timeout", 30)
-        self.max_retries = getattr(self.config, f"{name}_max_retries", 3)
-        self.rate_limit = getattr(self.config, f"{name}_rate_limit", 100)
+        self.timeout, self.max_retries, self.rate_limit = _get_provider_settings(name)
 
         # Initialize circuit breaker
         cb_registry = get_circuit_breaker_registry()
@@ -161,14 +250,42 @@ class BaseProvider(ABC):
         # Initialize metrics
         self.metrics = ProviderMetrics(name)
 
-        # HTTP client
-        self.client = httpx.AsyncClient(timeout=self.timeout)
+        # Retry policy compiled once; decorating per call would rebuild
+        # the wait/stop objects on every request
+        self._retrying_fetch = retry(
+            stop=stop_after_attempt(self.max_retries),
+            wait=wait_exponential(multiplier=1, min=2, max=30) +
+                 wait_exponential(multiplier=0.5, min=0, max=2),  # Add jitter
+            retry=retry_if_exception_type((httpx.HTTPError, TimeoutError)),
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+        )(self.fetch_gpus)
+
+        # HTTP client: provider-specific headers and timeout over the
+        # shared connection pool
+        self.client = client or httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout, connect=5.0),
+            transport=_get_shared_transport(),
+        )
+
+        # Last-fetch memo: the most recent normalized listings plus an
+        # external_id index, so repeat get_gpus calls within the TTL and
+        # single-GPU lookups skip the provider round trip entirely
+        self._fetch_cache: Optional[List[Dict[str, Any]]] = None
+        self._fetch_cache_expires = 0.0
+        self._fetch_cache_by_id: Dict[str, Dict[str, Any]] = {}
+        self._fetch_lock = asyncio.Lock()
 
         logger.info(f"Provider '{name}' initialized")
 
     async def close(self):
-        """Close provider resources"""
-        await self.client.aclose()
+        """
+        Close provider resources
+
+        The connection pool behind the default client is shared across
+        providers; close_shared_transport() tears it down once at
+        shutdown, and injected clients belong to their caller.
+        """
+        pass
 
     @abstractmethod
     async def fetch_gpus(self) -> List[Dict[str, Any]]:
@@ -196,13 +313,52 @@ class BaseProvider(ABC):
         """
         pass
 
-    async def get_gpus(self) -> List[Dict[str, Any]]:
+    def normalize_many(self, raw_gpus: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Normalize a batch of raw GPU records
+
+        The default hoists the bound method lookup out of the loop and
+        fills a preallocated list. Subclasses whose payloads have a
+        uniform shape can override this to normalize numeric fields
+        (price, memory) in bulk instead of per record.
+
+        Args:
+            raw_gpus: Raw GPU data from provider
+
+        Returns:
+            List of normalized GPU dictionaries
+        """
+        normalize = self.normalize_gpu_data
+        out: List[Dict[str, Any]] = [None] * len(raw_gpus)
+        for i, gpu in enumerate(raw_gpus):
+            out[i] = normalize(gpu)
+        return out
+
+    async def get_gpus(self, use_cache: bool = True) -> List[Dict[str, Any]]:
         """
         Get GPUs with all reliability patterns applied
 
+        Results are memoized for provider_cache_ttl seconds; concurrent
+        callers during a refresh share one fetch via the lock instead of
+        stampeding the provider.
+
+        Args:
+            use_cache: Serve the last fetch while it is fresh
+
         Returns:
             List of normalized GPU dictionaries
         """
+        if use_cache and self._fetch_cache is not None and _now() < self._fetch_cache_expires:
+            return self._fetch_cache
+
+        async with self._fetch_lock:
+            # A queued waiter may find the cache refreshed by the holder
+            if use_cache and self._fetch_cache is not None and _now() < self._fetch_cache_expires:
+                return self._fetch_cache
+            return await self._get_gpus_uncached()
+
+    async def _get_gpus_uncached(self) -> List[Dict[str, Any]]:
+        """Run the full rate-limit/breaker/retry fetch and refresh the memo"""
         start_time = time.time()
 
         try:
@@ -214,16 +370,27 @@ class BaseProvider(ABC):
                 logger.warning(f"{self.name}: Rate limit exceeded, retry after {e.retry_after:.2f}s")
                 raise
 
-            # Apply circuit breaker
+            # Apply circuit breaker; acall awaits the fetch so failures
+            # count against the breaker instead of escaping as an
+            # unawaited coroutine
             try:
-                raw_gpus = await self.circuit_breaker.call(self._fetch_with_retry)
+                raw_gpus = await self.circuit_breaker.acall(self._fetch_with_retry)
             except CircuitBreakerOpen as e:
                 self.metrics.record_circuit_breaker_trip()
                 logger.warning(f"{self.name}: {str(e)}")
                 raise
 
             # Normalize data
-            normalized_gpus = [self.normalize_gpu_data(gpu) for gpu in raw_gpus]
+            normalized_gpus = self.normalize_many(raw_gpus)
+
+            # Refresh the memo and the by-id index
+            self._fetch_cache = normalized_gpus
+            self._fetch_cache_expires = _now() + self.config.provider_cache_ttl
+            self._fetch_cache_by_id = {
+                gpu["external_id"]: gpu
+                for gpu in normalized_gpus
+                if gpu.get("external_id")
+            }
 
             # Record success
             duration = time.time() - start_time
@@ -243,24 +410,33 @@ class BaseProvider(ABC):
             logger.error(f"{self.name}: Failed to fetch GPUs: {str(e)}")
             raise
 
-    async def _fetch_with_retry(self) -> List[Dict[str, Any]]:
+    async def get_gpu_details(self, external_id: str) -> Optional[Dict[str, Any]]:
         """
-        Fetch with retry logic
+        Look up one normalized listing by its external id
+
+        Served from the by-id index of the last fetch, so N sequential
+        lookups cost one fetch plus N dict reads instead of N full
+        refetches. Providers with a true per-device endpoint override
+        this.
+
+        Args:
+            external_id: Provider-assigned GPU identifier
 
-        Uses tenacity for exponential backoff with jitter
+        Returns:
+            Normalized GPU dictionary or None if unknown
         """
+        if self._fetch_cache is None or _now() >= self._fetch_cache_expires:
+            await self.get_gpus()
+        return self._fetch_cache_by_id.get(external_id)
 
-        @retry(
-            stop=stop_after_attempt(self.max_retries),
-            wait=wait_exponential(multiplier=1, min=2, max=30) +
-                 wait_exponential(multiplier=0.5, min=0, max=2),  # Add jitter
-            retry=retry_if_exception_type((httpx.HTTPError, TimeoutError)),
-            before_sleep=before_sleep_log(logger, logging.WARNING),
-        )
-        async def _fetch():
-            return await self.fetch_gpus()
+    async def _fetch_with_retry(self) -> List[Dict[str, Any]]:
+        """
+        Fetch with retry logic
 
-        return await _fetch()
+        Uses the tenacity policy built in __init__ for exponential
+        backoff with jitter
+        """
+        return await self._retrying_fetch()
 
     def get_status(self) -> ProviderStatus:
         """Get current provider health status"""
@@ -281,8 +457,17 @@ class BaseProvider(ABC):
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get provider metrics"""
+        stats = self.metrics.get_stats()
+        last_request_time = stats["last_request_time"]
+        # Format the timestamp only here, at the serialization boundary;
+        # the spread also copies the shared stats snapshot
         return {
-            **self.metrics.get_stats(),
+            **stats,
+            "last_request_time": (
+                datetime.fromtimestamp(last_request_time).isoformat()
+                if last_request_time
+                else None
+            ),
             "status": self.get_status().value,
             "circuit_breaker_state": self.circuit_breaker.get_state().value,
             "rate_limiter_tokens": self.rate_limiter.get_available_tokens(),
@@ -311,19 +496,23 @@ class ProviderRegistry:
 
     def __init__(self):
         self._providers: Dict[str, BaseProvider] = {}
+        # Immutable snapshot rebuilt on registration; lets get_all()
+        # return without allocating a new list per call
+        self._all_snapshot: Tuple[BaseProvider, ...] = ()
 
     def register(self, provider: BaseProvider):
         """Register a provider"""
         self._providers[provider.name] = provider
+        self._all_snapshot = tuple(self._providers.values())
         logger.info(f"Registered provider: {provider.name}")
 
     def get(self, name: str) -> Optional[BaseProvider]:
         """Get provider by name"""
         return self._providers.get(name)
 
-    def get_all(self) -> List[BaseProvider]:
-        """Get all providers"""
-        return list(self._providers.values())
+    def get_all(self) -> Tuple[BaseProvider, ...]:
+        """Get all providers (shared immutable snapshot)"""
+        return self._all_snapshot
 
     def get_healthy(self) -> List[BaseProvider]:
         """Get all healthy providers"""
@@ -340,16 +529,31 @@ class ProviderRegistry:
         }
 
     async def health_check_all(self) -> Dict[str, bool]:
-        """Health check all providers"""
-        results = {}
-        for name, provider in self._providers.items():
-            results[name] = await provider.health_check()
-        return results
+        """
+        Health check all providers concurrently
+
+        Wall time is the slowest provider rather than the sum of all of
+        them; a provider that raises counts as unhealthy.
+        """
+        if not self._providers:
+            return {}
+        names = list(self._providers)
+        outcomes = await asyncio.gather(
+            *(self._providers[name].health_check() for name in names),
+            return_exceptions=True,
+        )
+        return {
+            name: outcome is True for name, outcome in zip(names, outcomes)
+        }
 
     async def close_all(self):
-        """Close all providers"""
-        for provider in self._providers.values():
-            await provider.close()
+        """Close all providers and the shared HTTP transport"""
+        if self._providers:
+            await asyncio.gather(
+                *(provider.close() for provider in self._providers.values()),
+                return_exceptions=True,
+            )
+        await close_shared_transport()
 
 
 # Global registry
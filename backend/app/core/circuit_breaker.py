@@ -5,6 +5,7 @@ Prevents cascading failures by tracking provider health
 
 import time
 import logging
+from collections import deque
 from enum import Enum
 from typing import Callable, Any, Optional
 from datetime import datetime, timedelta
@@ -27,22 +28,25 @@ class CircuitBreakerStats:
     success_count: int = 0
     last_failure_time: Optional[float] = None
     last_success_time: Optional[float] = None
-    state_changes: list[tuple[CircuitState, float]] = field(default_factory=list)
+    # Bounded so long-lived breakers don't accumulate transition history
+    state_changes: deque[tuple[CircuitState, float]] = field(
+        default_factory=lambda: deque(maxlen=128)
+    )
 
-    def record_success(self):
+    def record_success(self, now: float):
         """Record a successful call"""
         self.success_count += 1
-        self.last_success_time = time.time()
+        self.last_success_time = now
         self.failure_count = 0  # Reset failure count on success
 
-    def record_failure(self):
+    def record_failure(self, now: float):
         """Record a failed call"""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = now
 
-    def record_state_change(self, state: CircuitState):
+    def record_state_change(self, state: CircuitState, now: float):
         """Record a state transition"""
-        self.state_changes.append((state, time.time()))
+        self.state_changes.append((state, now))
 
 
 class CircuitBreakerOpen(Exception):
@@ -90,23 +94,45 @@ class CircuitBreaker:
         self.state = CircuitState.CLOSED
         self.stats = CircuitBreakerStats()
         self._last_state_change = time.time()
+        # Optional observer notified on every state change; set by the
+        # registry so it can maintain aggregates incrementally
+        self.on_state_change: Optional[Callable[[str, CircuitState], None]] = None
 
-    def _should_attempt_reset(self) -> bool:
+    def _should_attempt_reset(self, now: float) -> bool:
         """Check if enough time has passed to try recovery"""
-        return time.time() - self._last_state_change >= self.recovery_timeout
+        return now - self._last_state_change >= self.recovery_timeout
 
-    def _transition_to(self, new_state: CircuitState):
+    def _transition_to(self, new_state: CircuitState, now: Optional[float] = None):
         """Transition to a new state"""
+        if now is None:
+            now = time.time()
         old_state = self.state
         self.state = new_state
-        self._last_state_change = time.time()
-        self.stats.record_state_change(new_state)
+        self._last_state_change = now
+        self.stats.record_state_change(new_state, now)
+
+        if self.on_state_change:
+            self.on_state_change(self.name, new_state)
 
         logger.info(
             f"Circuit breaker '{self.name}' transitioned: "
             f"{old_state.value} -> {new_state.value}"
         )
 
+    def _before_call(self, now: float):
+        """
+        Gate a call on the current state
+
+        Transitions OPEN -> HALF_OPEN once the recovery timeout has
+        elapsed, otherwise rejects with CircuitBreakerOpen.
+        """
+        if self.state == CircuitState.OPEN:
+            if self._should_attempt_reset(now):
+                self._transition_to(CircuitState.HALF_OPEN, now)
+            else:
+                retry_after = self.recovery_timeout - (now - self._last_state_change)
+                raise CircuitBreakerOpen(self.name, retry_after)
+
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """
         Execute a function through the circuit breaker
@@ -122,44 +148,67 @@ class CircuitBreaker:
             CircuitBreakerOpen: If circuit is open
             Exception: Any exception from the function
         """
-        # Check current state
-        if self.state == CircuitState.OPEN:
-            if self._should_attempt_reset():
-                self._transition_to(CircuitState.HALF_OPEN)
-            else:
-                retry_after = self.recovery_timeout - (time.time() - self._last_state_change)
-                raise CircuitBreakerOpen(self.name, retry_after)
+        self._before_call(time.time())
 
         # Attempt the call
         try:
             result = func(*args, **kwargs)
-            self._on_success()
-            return result
         except Exception as e:
-            self._on_failure()
+            self._on_failure(time.time())
+            raise e
+        self._on_success(time.time())
+        return result
+
+    async def acall(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Execute an async function through the circuit breaker
+
+        Same semantics as call(), but awaits the callee so failures are
+        classified against the awaited result rather than the coroutine
+        object itself.
+
+        Args:
+            func: Coroutine function to execute
+            *args, **kwargs: Arguments to pass to the function
+
+        Returns:
+            Awaited result of the function call
+
+        Raises:
+            CircuitBreakerOpen: If circuit is open
+            Exception: Any exception from the function
+        """
+        self._before_call(time.time())
+
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            self._on_failure(time.time())
             raise e
+        self._on_success(time.time())
+        return result
 
-    def _on_success(self):
+    def _on_success(self, now: float):
         """Handle successful call"""
-        self.stats.record_success()
+        self.stats.record_success(now)
 
         if self.state == CircuitState.HALF_OPEN:
             if self.stats.success_count >= self.success_threshold:
-                self._transition_to(CircuitState.CLOSED)
+                self._transition_to(CircuitState.CLOSED, now)
                 logger.info(f"Circuit breaker '{self.name}' recovered after {self.success_threshold} successes")
 
-    def _on_failure(self):
+    def _on_failure(self, now: float):
         """Handle failed call"""
-        self.stats.record_failure()
+        self.stats.record_failure(now)
 
         if self.state == CircuitState.HALF_OPEN:
             # Failed during recovery test, go back to open
-            self._transition_to(CircuitState.OPEN)
+            self._transition_to(CircuitState.OPEN, now)
             logger.warning(f"Circuit breaker '{self.name}' failed recovery test")
 
         elif self.state == CircuitState.CLOSED:
             if self.stats.failure_count >= self.failure_threshold:
-                self._transition_to(CircuitState.OPEN)
+                self._transition_to(CircuitState.OPEN, now)
                 logger.error(
                     f"Circuit breaker '{self.name}' opened after "
                     f"{self.stats.failure_count} failures"
@@ -178,6 +227,8 @@ class CircuitBreaker:
         self.state = CircuitState.CLOSED
         self.stats = CircuitBreakerStats()
         self._last_state_change = time.time()
+        if self.on_state_change:
+            self.on_state_change(self.name, CircuitState.CLOSED)
         logger.info(f"Circuit breaker '{self.name}' manually reset")
 
     def is_healthy(self) -> bool:
@@ -190,6 +241,16 @@ class CircuitBreakerRegistry:
 
     def __init__(self):
         self._breakers: dict[str, CircuitBreaker] = {}
+        # Names of breakers currently OPEN, maintained incrementally on
+        # state transitions so aggregate queries avoid O(N) scans
+        self._unhealthy: set[str] = set()
+
+    def _track_state_change(self, name: str, state: CircuitState):
+        """Keep the unhealthy set in sync with breaker transitions"""
+        if state == CircuitState.OPEN:
+            self._unhealthy.add(name)
+        else:
+            self._unhealthy.discard(name)
 
     def get_or_create(
         self,
@@ -200,12 +261,14 @@ class CircuitBreakerRegistry:
     ) -> CircuitBreaker:
         """Get existing circuit breaker or create new one"""
         if name not in self._breakers:
-            self._breakers[name] = CircuitBreaker(
+            breaker = CircuitBreaker(
                 name=name,
                 failure_threshold=failure_threshold,
                 recovery_timeout=recovery_timeout,
                 success_threshold=success_threshold,
             )
+            breaker.on_state_change = self._track_state_change
+            self._breakers[name] = breaker
         return self._breakers[name]
 
     def get(self, name: str) -> Optional[CircuitBreaker]:
@@ -226,14 +289,11 @@ class CircuitBreakerRegistry:
 
     def get_healthy_count(self) -> int:
         """Get count of healthy circuits"""
-        return sum(1 for breaker in self._breakers.values() if breaker.is_healthy())
+        return len(self._breakers) - len(self._unhealthy)
 
     def get_unhealthy_providers(self) -> list[str]:
         """Get list of providers with open circuits"""
-        return [
-            name for name, breaker in self._breakers.items()
-            if breaker.get_state() == CircuitState.OPEN
-        ]
+        return list(self._unhealthy)
 
 
 # Global registry
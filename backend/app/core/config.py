@@ -2,9 +2,12 @@
 Application Configuration
 Uses pydantic-settings for environment variable management
 """
-from pydantic_settings import BaseSettings
+from functools import cached_property, lru_cache
 from typing import List
 
+from pydantic import computed_field
+from pydantic_settings import BaseSettings
+
 
 class Settings(BaseSettings):
     """Application settings from environment variables"""
@@ -34,6 +37,13 @@ class Settings(BaseSettings):
     ARBITRAGE_MIN_SPREAD_PCT: float = 15.0
     ARBITRAGE_CACHE_TTL: int = 30
 
+    # Health monitoring
+    HEALTH_CACHE_TTL: int = 3
+
+    # Startup: block readiness on provider init instead of booting
+    # providers in the background
+    PROVIDER_REQUIRED_AT_BOOT: bool = False
+
     # Provider API Keys (optional for MVP)
     RENDER_API_KEY: str = ""
     AKASH_API_KEY: str = ""
@@ -48,9 +58,38 @@ class Settings(BaseSettings):
     WEB3_PROVIDER_URL: str = ""
     USDC_CONTRACT_ADDRESS: str = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
 
+    # Derived URLs: built once per instance and included in model_dump,
+    # so call sites stop reassembling the same f-strings
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def docs_url(self) -> str:
+        return f"{self.API_V1_PREFIX}/docs"
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def redoc_url(self) -> str:
+        return f"{self.API_V1_PREFIX}/redoc"
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def login_url(self) -> str:
+        return f"{self.API_V1_PREFIX}/auth/login"
+
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the cached application settings (one .env parse per process)"""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Lazy module attribute (PEP 562): `from app.core.config import
+    # settings` materializes the Settings object on first access, so
+    # importing this module alone never parses .env
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
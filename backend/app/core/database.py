@@ -12,6 +12,8 @@ engine = create_async_engine(
     echo=settings.DEBUG,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=10,
+    pool_timeout=5,
+    pool_recycle=3600,
     pool_pre_ping=True,
 )
 
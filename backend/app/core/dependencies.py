@@ -2,19 +2,101 @@
 FastAPI Dependencies
 Reusable dependency functions for routes
 """
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
+from app.core.config import get_settings
 from app.core.database import get_db
 from app.core.security import decode_access_token
 from app.models import User
 from app.schemas import TokenData
 
-# OAuth2 scheme for JWT tokens
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"/api/auth/login")
+# OAuth2 scheme for JWT tokens; tokenUrl derived from settings so it
+# tracks API_V1_PREFIX instead of hardcoding /api
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl=get_settings().login_url)
+
+# Non-erroring variant for optional-auth endpoints: yields None instead
+# of raising 401 when the Authorization header is missing
+oauth2_scheme_optional = OAuth2PasswordBearer(
+    tokenUrl=get_settings().login_url, auto_error=False
+)
+
+# Compiled once at import; every authenticated request binds the email
+# instead of rebuilding the select expression
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+# Decoded-JWT cache: signature verification runs per request for the
+# same token, so verified payloads are kept briefly, keyed by a token
+# hash (never the raw JWT) and never past the token's own exp
+_TOKEN_CACHE: OrderedDict = OrderedDict()
+_TOKEN_CACHE_MAX = 4096
+_TOKEN_CACHE_TTL = 30.0
+# Failed decodes are cached too (briefly), so a client replaying a bad
+# or expired token doesn't cost an HMAC verify per attempt; the sentinel
+# distinguishes "known bad" from "not cached"
+_JWT_INVALID = object()
+_TOKEN_CACHE_ERROR_TTL = 10.0
+
+# Authenticated-user cache: bursty clients re-auth with the same token
+# many times per second, so the resolved User is reused briefly and the
+# SELECT is skipped entirely. Tokens that just failed are cached as a
+# sentinel so repeated bad-auth attempts short-circuit too.
+_USER_CACHE: OrderedDict = OrderedDict()
+_USER_CACHE_MAX = 10000
+_USER_CACHE_TTL = 5.0
+_INVALID_TOKEN = object()
+
+
+def _cache_user(key: bytes, value, now: float):
+    """Store a resolved user (or the invalid sentinel) with eviction"""
+    _USER_CACHE[key] = (now + _USER_CACHE_TTL, value)
+    _USER_CACHE.move_to_end(key)
+    if len(_USER_CACHE) > _USER_CACHE_MAX:
+        _USER_CACHE.popitem(last=False)
+
+
+def _decode_token_cached(token: str) -> Optional[dict]:
+    """Decode a JWT, reusing a recently verified payload when possible"""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+
+    entry = _TOKEN_CACHE.get(key)
+    if entry is not None and entry[0] > now:
+        _TOKEN_CACHE.move_to_end(key)
+        return None if entry[1] is _JWT_INVALID else entry[1]
+
+    payload = decode_access_token(token)
+    if payload is None:
+        expires = now + _TOKEN_CACHE_ERROR_TTL
+        cached = _JWT_INVALID
+    else:
+        expires = now + _TOKEN_CACHE_TTL
+        exp = payload.get("exp")
+        if exp is not None:
+            expires = min(expires, float(exp))
+        cached = payload
+    _TOKEN_CACHE[key] = (expires, cached)
+    _TOKEN_CACHE.move_to_end(key)
+    if len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX:
+        _TOKEN_CACHE.popitem(last=False)
+    return payload
+
+
+def freshness_cutoff() -> datetime:
+    """
+    One-hour freshness cutoff for GPU listing queries
+
+    Computed once per request so every query in the same request sees
+    the identical bound parameter.
+    """
+    return datetime.utcnow() - timedelta(hours=1)
 
 
 async def get_current_user(
@@ -40,24 +122,38 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    entry = _USER_CACHE.get(key)
+    if entry is not None and entry[0] > now:
+        _USER_CACHE.move_to_end(key)
+        if entry[1] is _INVALID_TOKEN:
+            raise credentials_exception
+        # Re-attach the detached instance to this request's session
+        # without emitting a SELECT (attributes stay loaded because the
+        # session factory uses expire_on_commit=False)
+        return await db.merge(entry[1], load=False)
+
     # Decode token
-    payload = decode_access_token(token)
+    payload = _decode_token_cached(token)
     if payload is None:
+        _cache_user(key, _INVALID_TOKEN, now)
         raise credentials_exception
 
     email: Optional[str] = payload.get("sub")
     if email is None:
+        _cache_user(key, _INVALID_TOKEN, now)
         raise credentials_exception
 
     # Get user from database
-    result = await db.execute(
-        select(User).where(User.email == email)
-    )
+    result = await db.execute(_USER_BY_EMAIL, {"email": email})
     user = result.scalar_one_or_none()
 
     if user is None:
+        _cache_user(key, _INVALID_TOKEN, now)
         raise credentials_exception
 
+    _cache_user(key, user, now)
     return user
 
 
@@ -84,13 +180,19 @@ async def get_current_active_user(
 
 
 async def get_optional_user(
-    token: Optional[str] = Depends(oauth2_scheme),
+    token: Optional[str] = Depends(oauth2_scheme_optional),
     db: AsyncSession = Depends(get_db)
 ) -> Optional[User]:
     """
     Get current user if authenticated, None otherwise
     Useful for endpoints that work with or without auth
 
+    Uses the auto_error=False scheme so an absent Authorization header
+    reaches this function as None instead of being rejected with 401 by
+    the scheme itself. The direct get_current_user call is deduplicated
+    by the token/user caches, so a tree that also resolves
+    get_current_user does not decode or query twice.
+
     Args:
         token: Optional JWT token
         db: Database session
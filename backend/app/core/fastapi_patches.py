@@ -0,0 +1,52 @@
+"""
+Startup-Time FastAPI Tweaks
+Memoizes dependency signature inspection during route registration
+"""
+import logging
+from weakref import WeakKeyDictionary
+
+logger = logging.getLogger(__name__)
+
+# Signature per dependency callable; weak keys so nothing is pinned alive
+_signature_cache: WeakKeyDictionary = WeakKeyDictionary()
+_original_get_typed_signature = None
+
+
+def install_signature_cache() -> None:
+    """
+    Memoize fastapi.dependencies.utils.get_typed_signature
+
+    FastAPI re-inspects every dependency callable each time a route is
+    registered, and include_router re-registers routes, so shared
+    dependencies (get_db, get_current_active_user, ...) get the same
+    inspect.signature + typing.get_type_hints work repeated dozens of
+    times at startup. Signatures of module-level callables never change,
+    so the result is cached per callable.
+
+    Must run before the router modules are imported, since their route
+    decorators build dependants at import time. Idempotent.
+    """
+    global _original_get_typed_signature
+
+    if _original_get_typed_signature is not None:
+        return
+
+    from fastapi.dependencies import utils
+
+    original = utils.get_typed_signature
+
+    def cached_get_typed_signature(call):
+        try:
+            sig = _signature_cache.get(call)
+        except TypeError:
+            # Not weak-referenceable (e.g. some callable instances);
+            # fall through to the uncached path
+            return original(call)
+        if sig is None:
+            sig = original(call)
+            _signature_cache[call] = sig
+        return sig
+
+    _original_get_typed_signature = original
+    utils.get_typed_signature = cached_get_typed_signature
+    logger.debug("Installed cached get_typed_signature")
@@ -3,7 +3,10 @@ Provider Configuration Management
 Centralized configuration for all GPU provider integrations
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Optional
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -49,6 +52,7 @@ class ProviderAPIConfig(BaseSettings):
     provider_circuit_breaker_threshold: int = Field(5, env="PROVIDER_CIRCUIT_BREAKER_THRESHOLD")
     provider_circuit_breaker_timeout: int = Field(60, env="PROVIDER_CIRCUIT_BREAKER_TIMEOUT")  # seconds
     provider_cache_ttl: int = Field(30, env="PROVIDER_CACHE_TTL")  # seconds
+    provider_cache_pool_size: int = Field(32, env="PROVIDER_CACHE_POOL_SIZE")  # Redis connections
     provider_health_check_interval: int = Field(300, env="PROVIDER_HEALTH_CHECK_INTERVAL")  # seconds
     provider_fallback_enabled: bool = Field(True, env="PROVIDER_FALLBACK_ENABLED")
 
@@ -62,16 +66,10 @@ class ProviderAPIConfig(BaseSettings):
         case_sensitive = False
 
 
-# Singleton instance
-_provider_config: Optional[ProviderAPIConfig] = None
-
-
+@lru_cache(maxsize=1)
 def get_provider_config() -> ProviderAPIConfig:
     """Get the provider configuration singleton"""
-    global _provider_config
-    if _provider_config is None:
-        _provider_config = ProviderAPIConfig()
-    return _provider_config
+    return ProviderAPIConfig()
 
 
 # Provider metadata for discovery and management
@@ -118,26 +116,44 @@ PROVIDER_METADATA = {
     },
 }
 
+# Freeze the metadata: every entry is shared read-only across callers,
+# so a mapping proxy makes accidental mutation impossible without
+# copying anything
+PROVIDER_METADATA = {
+    name: MappingProxyType(meta) for name, meta in PROVIDER_METADATA.items()
+}
+
+# (provider name, enabled-flag attribute, frozen metadata) in a fixed
+# tuple so get_enabled_providers iterates instead of repeating the
+# per-provider if-blocks
+_PROVIDERS = tuple(
+    (name, f"{name}_enabled", meta) for name, meta in PROVIDER_METADATA.items()
+)
 
-def get_enabled_providers() -> Dict[str, dict]:
-    """Get list of enabled providers with their metadata"""
-    config = get_provider_config()
-    enabled = {}
 
-    if config.vastai_enabled:
-        enabled["vastai"] = PROVIDER_METADATA["vastai"]
-    if config.akash_enabled:
-        enabled["akash"] = PROVIDER_METADATA["akash"]
-    if config.render_enabled:
-        enabled["render"] = PROVIDER_METADATA["render"]
-    if config.ionet_enabled:
-        enabled["ionet"] = PROVIDER_METADATA["ionet"]
+@lru_cache(maxsize=1)
+def get_enabled_providers() -> Dict[str, dict]:
+    """
+    Get list of enabled providers with their metadata
 
-    return enabled
+    Enablement is immutable after startup, so the dict is built once.
+    """
+    config = get_provider_config()
+    return {
+        name: meta
+        for name, flag_attr, meta in _PROVIDERS
+        if getattr(config, flag_attr)
+    }
 
 
+@lru_cache(maxsize=8)
 def is_provider_configured(provider_name: str) -> bool:
-    """Check if a provider has required API keys configured"""
+    """
+    Check if a provider has required API keys configured
+
+    Memoized: keys don't change after startup, so repeat checks are a
+    single cache lookup.
+    """
     config = get_provider_config()
 
     api_key_requirements = {
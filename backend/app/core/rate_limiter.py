@@ -3,9 +3,11 @@ Rate Limiter Implementation
 Token Bucket algorithm for API rate limiting
 """
 
+import asyncio
 import time
 import logging
-from typing import Optional
+from enum import IntEnum
+from typing import Iterator, Optional
 from dataclasses import dataclass
 from threading import Lock
 
@@ -32,6 +34,10 @@ class TokenBucket:
     Tokens are added to the bucket at a constant rate.
     Each request consumes a token.
     When bucket is empty, requests are rate limited.
+
+    All callers run on the asyncio event loop and the refill/consume
+    section never yields, so bucket state needs no lock; the monotonic
+    clock keeps refill arithmetic immune to wall-clock jumps.
     """
 
     def __init__(
@@ -52,9 +58,12 @@ class TokenBucket:
         self.rate = rate
         self.capacity = capacity or int(rate)
 
-        self._tokens = float(self.capacity)
-        self._last_update = time.time()
-        self._lock = Lock()
+        # Fixed-point state: tokens scaled by 1e9 ("nanotokens") so the
+        # refill path is pure integer math on monotonic_ns timestamps
+        self._cap_scaled = self.capacity * 1_000_000_000
+        self._rate_scaled = int(rate * 1_000_000_000)  # nanotokens per second
+        self._tokens_scaled = self._cap_scaled
+        self._last_ns = time.monotonic_ns()
 
         logger.info(
             f"Rate limiter '{name}' initialized: "
@@ -63,13 +72,13 @@ class TokenBucket:
 
     def _refill(self):
         """Refill tokens based on elapsed time"""
-        now = time.time()
-        elapsed = now - self._last_update
+        now_ns = time.monotonic_ns()
+        elapsed_ns = now_ns - self._last_ns
 
-        # Add tokens based on elapsed time
-        new_tokens = elapsed * self.rate
-        self._tokens = min(self.capacity, self._tokens + new_tokens)
-        self._last_update = now
+        # Add tokens based on elapsed time (integer nanotokens)
+        new_scaled = elapsed_ns * self._rate_scaled // 1_000_000_000
+        self._tokens_scaled = min(self._cap_scaled, self._tokens_scaled + new_scaled)
+        self._last_ns = now_ns
 
     def acquire(self, tokens: int = 1, block: bool = True, timeout: Optional[float] = None) -> bool:
         """
@@ -86,98 +95,178 @@ class TokenBucket:
         Raises:
             RateLimitExceeded: If tokens not available and block=False
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        need_scaled = tokens * 1_000_000_000
 
         while True:
-            with self._lock:
-                self._refill()
+            self._refill()
 
-                if self._tokens >= tokens:
-                    self._tokens -= tokens
-                    return True
+            if self._tokens_scaled >= need_scaled:
+                self._tokens_scaled -= need_scaled
+                return True
 
-                if not block:
-                    wait_time = (tokens - self._tokens) / self.rate
-                    raise RateLimitExceeded(self.name, wait_time)
+            wait_time = (need_scaled - self._tokens_scaled) / self._rate_scaled
 
-                # Calculate wait time
-                wait_time = (tokens - self._tokens) / self.rate
+            if not block:
+                raise RateLimitExceeded(self.name, wait_time)
 
-                # Check timeout
-                if timeout is not None:
-                    elapsed = time.time() - start_time
-                    if elapsed >= timeout:
-                        raise RateLimitExceeded(self.name, wait_time)
-                    wait_time = min(wait_time, timeout - elapsed)
+            # Check timeout
+            if timeout is not None:
+                elapsed = time.monotonic() - start_time
+                if elapsed >= timeout:
+                    raise RateLimitExceeded(self.name, wait_time)
+                wait_time = min(wait_time, timeout - elapsed)
 
             # Sleep and retry
             time.sleep(min(wait_time, 0.1))  # Sleep max 100ms at a time
 
+    async def acquire_async(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire tokens without blocking the event loop
+
+        The blocking acquire() busy-polls with time.sleep, which stalls
+        every other request on the loop. This variant awaits
+        asyncio.sleep for the computed refill wait instead, re-checking
+        on wake-up in case another waiter consumed the refill first.
+
+        Args:
+            tokens: Number of tokens to acquire
+            timeout: Maximum time to wait
+
+        Returns:
+            True once tokens are acquired
+
+        Raises:
+            RateLimitExceeded: If the timeout elapses first
+        """
+        start_time = time.monotonic()
+        need_scaled = tokens * 1_000_000_000
+
+        while True:
+            self._refill()
+
+            if self._tokens_scaled >= need_scaled:
+                self._tokens_scaled -= need_scaled
+                return True
+
+            wait_time = (need_scaled - self._tokens_scaled) / self._rate_scaled
+
+            if timeout is not None:
+                elapsed = time.monotonic() - start_time
+                if elapsed >= timeout:
+                    raise RateLimitExceeded(self.name, wait_time)
+                wait_time = min(wait_time, timeout - elapsed)
+
+            await asyncio.sleep(wait_time)
+
+    def _available_scaled(self) -> int:
+        """Nanotokens available right now, computed without mutating state"""
+        elapsed_ns = time.monotonic_ns() - self._last_ns
+        return min(
+            self._cap_scaled,
+            self._tokens_scaled + elapsed_ns * self._rate_scaled // 1_000_000_000,
+        )
+
     def get_available_tokens(self) -> float:
         """Get current number of available tokens"""
-        with self._lock:
-            self._refill()
-            return self._tokens
+        return self._available_scaled() / 1_000_000_000
 
     def get_wait_time(self, tokens: int = 1) -> float:
         """Get estimated wait time for tokens to become available"""
-        with self._lock:
-            self._refill()
-            if self._tokens >= tokens:
-                return 0.0
-            return (tokens - self._tokens) / self.rate
+        available = self._available_scaled()
+        need_scaled = tokens * 1_000_000_000
+        if available >= need_scaled:
+            return 0.0
+        return (need_scaled - available) / self._rate_scaled
 
     def reset(self):
         """Reset the bucket to full capacity"""
-        with self._lock:
-            self._tokens = float(self.capacity)
-            self._last_update = time.time()
+        self._tokens_scaled = self._cap_scaled
+        self._last_ns = time.monotonic_ns()
         logger.info(f"Rate limiter '{self.name}' reset")
 
 
+class ProviderId(IntEnum):
+    """Slot index for the closed set of known providers"""
+    VASTAI = 0
+    AKASH = 1
+    RENDER = 2
+    IONET = 3
+
+
+_PROVIDER_INDEX = {member.name.lower(): int(member) for member in ProviderId}
+
+
 class RateLimiterRegistry:
     """Registry to manage multiple rate limiters"""
 
     def __init__(self):
-        self._limiters: dict[str, TokenBucket] = {}
+        # Known providers live in fixed slots so the lookup on the
+        # request path is an array index with no lock; anything else
+        # (tests, future providers) goes through the overflow dict
+        self._slots: list[Optional[TokenBucket]] = [None] * len(ProviderId)
+        self._overflow: dict[str, TokenBucket] = {}
         self._lock = Lock()
 
+    def _create(self, name: str, requests_per_minute: int) -> TokenBucket:
+        # Convert requests per minute to tokens per second
+        rate = requests_per_minute / 60.0
+        return TokenBucket(
+            name=name,
+            rate=rate,
+            capacity=requests_per_minute,  # Allow burst up to 1 minute worth
+        )
+
     def get_or_create(
         self,
         name: str,
         requests_per_minute: int,
     ) -> TokenBucket:
         """Get existing rate limiter or create new one"""
+        index = _PROVIDER_INDEX.get(name)
+        if index is not None:
+            limiter = self._slots[index]
+            if limiter is None:
+                with self._lock:
+                    if self._slots[index] is None:
+                        self._slots[index] = self._create(name, requests_per_minute)
+                limiter = self._slots[index]
+            return limiter
+
         with self._lock:
-            if name not in self._limiters:
-                # Convert requests per minute to tokens per second
-                rate = requests_per_minute / 60.0
-                self._limiters[name] = TokenBucket(
-                    name=name,
-                    rate=rate,
-                    capacity=requests_per_minute,  # Allow burst up to 1 minute worth
-                )
-            return self._limiters[name]
+            if name not in self._overflow:
+                self._overflow[name] = self._create(name, requests_per_minute)
+            return self._overflow[name]
 
     def get(self, name: str) -> Optional[TokenBucket]:
         """Get rate limiter by name"""
-        return self._limiters.get(name)
+        index = _PROVIDER_INDEX.get(name)
+        if index is not None:
+            return self._slots[index]
+        return self._overflow.get(name)
+
+    def _iter_limiters(self) -> Iterator[TokenBucket]:
+        """Iterate all created limiters, fixed slots first"""
+        for limiter in self._slots:
+            if limiter is not None:
+                yield limiter
+        yield from self._overflow.values()
 
     def get_all_stats(self) -> dict[str, dict]:
         """Get stats for all rate limiters"""
         return {
-            name: {
+            limiter.name: {
                 "available_tokens": limiter.get_available_tokens(),
                 "capacity": limiter.capacity,
                 "rate": limiter.rate,
                 "utilization": 1.0 - (limiter.get_available_tokens() / limiter.capacity),
             }
-            for name, limiter in self._limiters.items()
+            for limiter in self._iter_limiters()
         }
 
     def reset_all(self):
         """Reset all rate limiters"""
-        for limiter in self._limiters.values():
+        for limiter in self._iter_limiters():
             limiter.reset()
 
 
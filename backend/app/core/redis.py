@@ -0,0 +1,48 @@
+"""
+Redis Client Configuration
+Shared async Redis connection for response caching
+"""
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Shared client, created lazily on first use
+_redis_client: Optional[redis.Redis] = None
+
+
+async def get_redis() -> Optional[redis.Redis]:
+    """
+    Dependency for FastAPI routes
+    Provides the shared Redis client, or None if Redis is unreachable
+    """
+    global _redis_client
+
+    if _redis_client is None:
+        try:
+            client = redis.from_url(
+                settings.REDIS_URL,
+                encoding="utf-8",
+                decode_responses=True,
+            )
+            await client.ping()
+            _redis_client = client
+            logger.info("Connected to Redis for response caching")
+        except Exception as e:
+            logger.error(f"Redis connection failed: {e}")
+            return None
+
+    return _redis_client
+
+
+async def close_redis():
+    """Close the shared Redis connection"""
+    global _redis_client
+
+    if _redis_client is not None:
+        await _redis_client.close()
+        _redis_client = None
@@ -10,7 +10,16 @@ from passlib.context import CryptContext
 from app.core.config import settings
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2 for new hashes (SIMD-accelerated, tunable parallelism); bcrypt
+# stays registered so existing hashes keep verifying and are upgraded
+# on next login via deprecated="auto"
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,
+    argon2__parallelism=2,
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -2,14 +2,22 @@
 GP4U FastAPI Application
 Main entry point for the API server
 """
+import asyncio
 import logging
-from fastapi import FastAPI
+from decimal import Decimal
+from uuid import UUID
+
+import orjson
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.core.database import init_db, close_db
-from app.services.provider_init import initialize_providers, shutdown_providers
+from app.core.fastapi_patches import install_signature_cache
+from app.core.redis import close_redis
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +26,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Memoize dependency signature inspection before any router is imported;
+# route decorators and include_router re-inspect shared dependencies
+install_signature_cache()
+
+from app.api import auth, gpus, arbitrage, providers, reservations, clusters, wallets
+from app.api.v1 import provider_health
+from app.services.provider_init import initialize_providers, shutdown_providers
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -30,17 +46,29 @@ async def lifespan(app: FastAPI):
     logger.info(f"📋 Version: {settings.VERSION}")
     logger.info(f"🔧 Debug Mode: {settings.DEBUG}")
 
+    # Providers boot in the background so /health and the first requests
+    # aren't blocked behind slow provider APIs; the event lets endpoints
+    # report "initializing" until registration completes
+    app.state.providers_ready = asyncio.Event()
+
+    async def _init_providers():
+        try:
+            providers = await initialize_providers()
+            logger.info(f"✅ Initialized {len(providers)} GPU providers")
+        except Exception as e:
+            logger.error(f"⚠️ Provider initialization failed: {e}")
+            logger.warning("Continuing without providers - they can be initialized via API")
+        finally:
+            app.state.providers_ready.set()
+
+    init_task = asyncio.create_task(_init_providers())
+
     # Initialize database
     await init_db()
     logger.info("✅ Database initialized")
 
-    # Initialize providers (Phase 7)
-    try:
-        providers = await initialize_providers()
-        logger.info(f"✅ Initialized {len(providers)} GPU providers")
-    except Exception as e:
-        logger.error(f"⚠️ Provider initialization failed: {e}")
-        logger.warning("Continuing without providers - they can be initialized via API")
+    if settings.PROVIDER_REQUIRED_AT_BOOT:
+        await init_task
 
     logger.info("🎉 GP4U API Ready!")
     yield
@@ -48,6 +76,11 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("🛑 Shutting down GP4U API...")
 
+    # Don't tear providers down underneath an in-flight init
+    if not init_task.done():
+        init_task.cancel()
+        await asyncio.gather(init_task, return_exceptions=True)
+
     # Shutdown providers
     try:
         await shutdown_providers()
@@ -55,20 +88,46 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"⚠️ Provider shutdown error: {e}")
 
-    # Close database
+    # Close Redis and database
+    await close_redis()
     await close_db()
     logger.info("✅ Database connections closed")
     logger.info("👋 GP4U API Stopped")
 
 
+def _orjson_default(obj):
+    """Serialize the money/id types orjson has no native encoding for"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError
+
+
+class APIResponse(ORJSONResponse):
+    """
+    ORJSONResponse that also accepts Decimal and UUID directly
+
+    Handlers that return raw dicts (bypassing jsonable_encoder via
+    response_model=None) can include Decimal prices and UUID ids without
+    a pre-serialization pass.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content, default=_orjson_default, option=orjson.OPT_NAIVE_UTC
+        )
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
     description="The Kayak of GPUs - Decentralized GPU Brokerage Platform",
     lifespan=lifespan,
-    docs_url=f"{settings.API_V1_PREFIX}/docs",
-    redoc_url=f"{settings.API_V1_PREFIX}/redoc",
+    docs_url=settings.docs_url,
+    redoc_url=settings.redoc_url,
+    default_response_class=APIResponse,
 )
 
 # CORS Middleware
@@ -80,15 +139,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (GPU lists, opportunities) on the wire
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 
 # Health check endpoint
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint"""
+    providers_ready = getattr(request.app.state, "providers_ready", None)
     return {
         "status": "healthy",
         "app": settings.APP_NAME,
-        "version": settings.VERSION
+        "version": settings.VERSION,
+        "providers": (
+            "ready" if providers_ready and providers_ready.is_set() else "initializing"
+        ),
     }
 
 
@@ -98,22 +164,26 @@ async def root():
     return {
         "message": "Welcome to GP4U - The Kayak of GPUs",
         "version": settings.VERSION,
-        "docs": f"{settings.API_V1_PREFIX}/docs"
+        "docs": settings.docs_url
     }
 
 
-# Include API routers
-from app.api import auth, gpus, arbitrage, providers, reservations, clusters, wallets
-from app.api.v1 import provider_health
+# Include API routers, driven by one (router, path segment, tag) table
+_ROUTERS = (
+    (auth.router, "auth", "Authentication"),
+    (gpus.router, "gpus", "GPUs"),
+    (arbitrage.router, "arbitrage", "Arbitrage"),
+    (providers.router, "providers", "Providers"),
+    (reservations.router, "reservations", "Reservations"),
+    (clusters.router, "clusters", "Clusters"),
+    (wallets.router, "wallets", "Wallets"),
+    (provider_health.router, "provider-health", "Provider Health"),
+)
 
-app.include_router(auth.router, prefix=f"{settings.API_V1_PREFIX}/auth", tags=["Authentication"])
-app.include_router(gpus.router, prefix=f"{settings.API_V1_PREFIX}/gpus", tags=["GPUs"])
-app.include_router(arbitrage.router, prefix=f"{settings.API_V1_PREFIX}/arbitrage", tags=["Arbitrage"])
-app.include_router(providers.router, prefix=f"{settings.API_V1_PREFIX}/providers", tags=["Providers"])
-app.include_router(reservations.router, prefix=f"{settings.API_V1_PREFIX}/reservations", tags=["Reservations"])
-app.include_router(clusters.router, prefix=f"{settings.API_V1_PREFIX}/clusters", tags=["Clusters"])
-app.include_router(wallets.router, prefix=f"{settings.API_V1_PREFIX}/wallets", tags=["Wallets"])
-app.include_router(provider_health.router, prefix=f"{settings.API_V1_PREFIX}/provider-health", tags=["Provider Health"])
+for _router, _segment, _tag in _ROUTERS:
+    app.include_router(
+        _router, prefix=f"{settings.API_V1_PREFIX}/{_segment}", tags=[_tag]
+    )
 
 
 if __name__ == "__main__":
@@ -122,5 +192,7 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools"
     )
@@ -3,10 +3,10 @@ SQLAlchemy Models
 Database tables for GP4U platform
 """
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_EVEN
 from sqlalchemy import (
-    Column, String, Integer, Boolean, DateTime, Numeric, Text,
-    ForeignKey, Enum as SQLEnum
+    Column, String, Integer, BigInteger, Boolean, DateTime, Numeric, Text,
+    ForeignKey, Enum as SQLEnum, Identity, Index, TypeDecorator, text
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -62,6 +62,49 @@ class TransactionStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+# 1 USDC is stored as 1_000_000 integer micro-units; money columns use
+# BIGINT so balance arithmetic stays integer math instead of Decimal
+MICRO_USDC = 1_000_000
+
+
+class MoneyUSDC(TypeDecorator):
+    """
+    BIGINT micro-USDC on disk, Decimal USDC in Python
+
+    Fixed-width integers sort and aggregate several times faster than
+    variable-length numeric in Postgres; scaling by MICRO_USDC is
+    monotonic, so ORDER BY and range predicates behave identically.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        # from_float skips the Decimal(str(...)) string round-trip;
+        # banker's rounding (not int() truncation) lands sub-micro
+        # amounts on the nearest unit
+        if not isinstance(value, Decimal):
+            value = Decimal.from_float(float(value))
+        return int((value * MICRO_USDC).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(value) / MICRO_USDC
+
+
+def _enum(enum_cls):
+    """
+    Native Postgres enum storing member values, not member names
+
+    Values match what the API and raw SQL predicates use ('active', not
+    'ACTIVE'), and a native enum is 4 bytes on disk versus a label-length
+    string, which keeps the status indexes small.
+    """
+    return SQLEnum(enum_cls, values_callable=lambda e: [m.value for m in e])
+
+
 # Models
 class User(Base):
     """User accounts"""
@@ -70,8 +113,8 @@ class User(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(Text, nullable=False)
-    skill_level = Column(SQLEnum(SkillLevel), default=SkillLevel.BEGINNER)
-    theme_preference = Column(SQLEnum(ThemePreference), default=ThemePreference.PROFESSIONAL)
+    skill_level = Column(_enum(SkillLevel), default=SkillLevel.BEGINNER)
+    theme_preference = Column(_enum(ThemePreference), default=ThemePreference.PROFESSIONAL)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     last_login = Column(DateTime(timezone=True), nullable=True)
 
@@ -84,13 +127,37 @@ class User(Base):
 class GPU(Base):
     """GPU inventory cache from providers"""
     __tablename__ = "gpus"
+    __table_args__ = (
+        # Partial index serves available-GPU searches pre-sorted by price
+        Index(
+            "ix_gpus_available_price",
+            "price_per_hour",
+            postgresql_where=text("available = true"),
+        ),
+        # Composite index for the freshness filter + price ordering
+        Index("ix_gpus_sync_price", "last_synced", "price_per_hour"),
+        # Partial index so distinct-model listings come back pre-sorted
+        Index(
+            "ix_gpus_model_available",
+            "model",
+            postgresql_where=text("available = true"),
+        ),
+        # Partial composite matching the arbitrage fetch exactly:
+        # available rows filtered by model and sync freshness
+        Index(
+            "ix_gpus_model_synced_available",
+            "model",
+            "last_synced",
+            postgresql_where=text("available = true"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     provider = Column(String(50), nullable=False, index=True)
     external_id = Column(String(255), index=True)
     model = Column(String(100), nullable=False, index=True)
     vram_gb = Column(Integer)
-    price_per_hour = Column(Numeric(10, 2))
+    price_per_hour = Column(MoneyUSDC)  # micro-USDC on disk
     location = Column(String(100))
     available = Column(Boolean, default=True, index=True)
     g_score = Column(Numeric(5, 2))  # Performance score 0-1
@@ -108,14 +175,30 @@ class GPU(Base):
 class Reservation(Base):
     """Time-block GPU reservations"""
     __tablename__ = "reservations"
+    __table_args__ = (
+        # Partial index covering conflict checks and activation sweeps,
+        # which only ever look at open (pending/active) bookings
+        Index(
+            "ix_reservations_gpu_open",
+            "gpu_id",
+            "start_time",
+            postgresql_where=text("status IN ('pending', 'active')"),
+        ),
+        # Same restriction for per-user open-reservation listings
+        Index(
+            "ix_reservations_user_open",
+            "user_id",
+            postgresql_where=text("status IN ('pending', 'active')"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     gpu_id = Column(UUID(as_uuid=True), ForeignKey("gpus.id"), nullable=False)
     start_time = Column(DateTime(timezone=True), nullable=False)
     end_time = Column(DateTime(timezone=True), nullable=False)
-    total_cost = Column(Numeric(10, 2))
-    status = Column(SQLEnum(ReservationStatus), default=ReservationStatus.PENDING, index=True)
+    total_cost = Column(MoneyUSDC)  # micro-USDC on disk
+    status = Column(_enum(ReservationStatus), default=ReservationStatus.PENDING, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -126,13 +209,21 @@ class Reservation(Base):
 class Cluster(Base):
     """Multi-GPU clusters for distributed compute"""
     __tablename__ = "clusters"
+    __table_args__ = (
+        # Partial index for the common "my running clusters" listing
+        Index(
+            "ix_clusters_user_active",
+            "user_id",
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     job_name = Column(String(255))
     gpu_count = Column(Integer)
     total_cost = Column(Numeric(10, 2))
-    status = Column(SQLEnum(ClusterStatus), default=ClusterStatus.PENDING, index=True)
+    status = Column(_enum(ClusterStatus), default=ClusterStatus.PENDING, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -163,8 +254,16 @@ class Wallet(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, unique=True)
     address = Column(String(255), unique=True, index=True)
-    balance = Column(Numeric(20, 8), default=0)
+    balance = Column(BigInteger, default=0)  # micro-USDC
+    total_earned = Column(BigInteger, default=0)  # lifetime, micro-USDC
+    total_spent = Column(BigInteger, default=0)  # lifetime, micro-USDC
     currency = Column(String(10), default="USDC")
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Bumped on every balance change; /wallets/balance derives its ETag
+    # from this, so conditional polls can answer 304 without a body
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
 
     # Relationships
     user = relationship("User", back_populates="wallet")
@@ -174,12 +273,25 @@ class Wallet(Base):
 class Transaction(Base):
     """Wallet transactions"""
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Composite index so history pages avoid a sort
+        Index("ix_transactions_wallet_created", "wallet_id", "created_at"),
+        # Same, for pages filtered by transaction type
+        Index("ix_transactions_wallet_type_created", "wallet_id", "type", "created_at"),
+        # Unique partial index backing blockchain-hash idempotency checks
+        Index(
+            "ux_transactions_tx_hash",
+            "tx_hash",
+            unique=True,
+            postgresql_where=text("tx_hash IS NOT NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     wallet_id = Column(UUID(as_uuid=True), ForeignKey("wallets.id"), nullable=False)
-    amount = Column(Numeric(20, 8), nullable=False)
-    type = Column(SQLEnum(TransactionType), nullable=False, index=True)
-    status = Column(SQLEnum(TransactionStatus), default=TransactionStatus.PENDING, index=True)
+    amount = Column(BigInteger, nullable=False)  # micro-USDC
+    type = Column(_enum(TransactionType), nullable=False, index=True)
+    status = Column(_enum(TransactionStatus), default=TransactionStatus.PENDING, index=True)
     tx_hash = Column(String(255), nullable=True)  # Blockchain transaction hash
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -190,12 +302,20 @@ class Transaction(Base):
 class ArbitrageCache(Base):
     """Real-time arbitrage opportunities cache"""
     __tablename__ = "arbitrage_cache"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        # Composite index so per-type time-series reads hit one index
+        # instead of combining the single-column ones
+        Index("ix_arbitrage_type_time", "gpu_type", "timestamp"),
+    )
+
+    # Insert-heavy internal table whose rows are never referenced by id:
+    # an 8-byte sequential key keeps the PK B-tree dense on append,
+    # unlike the random 16-byte UUIDs used for externally visible rows
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     gpu_type = Column(String(100), nullable=False, index=True)
     cheapest_provider = Column(String(50))
-    cheapest_price = Column(Numeric(10, 2))
+    cheapest_price = Column(MoneyUSDC)  # micro-USDC on disk
     expensive_provider = Column(String(50))
-    expensive_price = Column(Numeric(10, 2))
+    expensive_price = Column(MoneyUSDC)  # micro-USDC on disk
     spread_pct = Column(Numeric(5, 2))
     timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
@@ -6,9 +6,9 @@ Decentralized cloud computing marketplace (blockchain-based)
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import json
 
 import httpx
+import orjson
 
 from ..core.base_provider import BaseProvider
 from ..core.provider_config import get_provider_config
@@ -16,6 +16,13 @@ from ..core.provider_config import get_provider_config
 
 logger = logging.getLogger(__name__)
 
+# G-Score weights (Akash gets an efficiency-heavy mix for its
+# decentralized cost advantage); hoisted to module scope so the
+# normalize hot path reads constants instead of re-built literals
+_PERF_WEIGHT = 0.3
+_REL_WEIGHT = 0.3
+_EFF_WEIGHT = 0.4
+
 
 class AkashProvider(BaseProvider):
     """
@@ -65,7 +72,9 @@ class AkashProvider(BaseProvider):
             response = await self.client.get(url)
             response.raise_for_status()
 
-            data = response.json()
+            # orjson parses the RPC payload several times faster than
+            # the stdlib json module behind response.json()
+            data = orjson.loads(response.content)
 
             providers = data.get("providers", [])
 
@@ -101,34 +110,29 @@ class AkashProvider(BaseProvider):
         Returns:
             List of GPU offerings
         """
-        gpus = []
-
-        # Common GPU models on Akash
-        gpu_models = [
-            {"model": "RTX 4090", "vram": 24, "base_price": 1.2},
-            {"model": "RTX 3090", "vram": 24, "base_price": 0.9},
-            {"model": "A100", "vram": 80, "base_price": 2.5},
-            {"model": "V100", "vram": 32, "base_price": 1.8},
-            {"model": "RTX A6000", "vram": 48, "base_price": 1.5},
+        # Common GPU models on Akash; 2 GPU types per provider for MVP.
+        # Offer fields that don't vary per provider (model, vram, the
+        # 30%-discounted price) are built once instead of per iteration.
+        # In production, per-provider attribute queries replace this and
+        # should be gathered concurrently under a bounded semaphore so 50
+        # round trips cost max(latency), not sum(latency).
+        offers = [
+            ("RTX 4090", 24, 1.2 * 0.7),
+            ("RTX 3090", 24, 0.9 * 0.7),
         ]
 
-        # Generate GPU offerings from providers
-        # In production, this comes from provider attributes on-chain
-        for i, provider in enumerate(providers[:50]):  # Limit to 50 for MVP
-            # Each provider might offer multiple GPU types
-            for gpu_model in gpu_models[:2]:  # 2 GPU types per provider
-                gpu_data = {
-                    "provider_address": provider.get("owner", ""),
-                    "host_uri": provider.get("host_uri", ""),
-                    "gpu_model": gpu_model["model"],
-                    "vram_gb": gpu_model["vram"],
-                    "price_per_hour": gpu_model["base_price"] * 0.7,  # 30% discount
-                    "attributes": provider.get("attributes", []),
-                }
-
-                gpus.append(gpu_data)
-
-        return gpus
+        return [
+            {
+                "provider_address": provider.get("owner", ""),
+                "host_uri": provider.get("host_uri", ""),
+                "gpu_model": model,
+                "vram_gb": vram,
+                "price_per_hour": price,
+                "attributes": provider.get("attributes", []),
+            }
+            for provider in providers[:50]  # Limit to 50 for MVP
+            for model, vram, price in offers
+        ]
 
     def normalize_gpu_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -142,53 +146,79 @@ class AkashProvider(BaseProvider):
         - price_per_hour: Hourly rate
         - attributes: Provider attributes (location, capabilities)
         """
-        # Calculate G-Score
-        # Akash emphasizes decentralization and cost-effectiveness
-        performance = 0.7  # Assume good performance
-        reliability = 0.75  # Decentralized reliability
+        return self.normalize_many([raw_data])[0]
 
-        price = float(raw_data.get("price_per_hour", 1.0))
-        efficiency = 1.0 / (price + 0.1)
-        efficiency = min(efficiency, 1.0)
+    def normalize_many(self, raw_gpus: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Bulk-normalize an Akash offering batch in a single pass
 
-        # Akash gets efficiency boost for decentralization
-        g_score = (performance * 0.3 + reliability * 0.3 + efficiency * 0.4) * 100
+        Same specialization as the io.net provider: one loop over the
+        uniform offering dicts with builtins, weights, and the fixed
+        performance/reliability scores bound to locals once per batch.
+        """
+        _float = float
+        _int = int
+        _min = min
+        _round = round
+        pw, rw, ew = _PERF_WEIGHT, _REL_WEIGHT, _EFF_WEIGHT
 
-        # Extract location from attributes
-        attributes = raw_data.get("attributes", [])
-        location = "Global"
-        for attr in attributes:
-            if attr.get("key") == "region":
-                location = attr.get("value", "Global")
-                break
+        # Akash emphasizes decentralization and cost-effectiveness
+        performance = 0.7  # Assume good performance
+        reliability = 0.75  # Decentralized reliability
+        fixed_score_part = performance * pw + reliability * rw
+
+        # One timestamp per batch; rows in a fetch share the same
+        # last_updated instant anyway
+        now_iso = datetime.utcnow().isoformat()
+
+        out: List[Dict[str, Any]] = [None] * len(raw_gpus)
+        for i, raw_data in enumerate(raw_gpus):
+            # Local bind so each field read is one call
+            g = raw_data.get
+
+            price = _float(g("price_per_hour", 1.0))
+            efficiency = _min(1.0 / (price + 0.1), 1.0)
+
+            # Akash gets efficiency boost for decentralization
+            g_score = (fixed_score_part + efficiency * ew) * 100
+
+            # Extract location from attributes
+            attributes = g("attributes", [])
+            location = "Global"
+            for attr in attributes:
+                if attr.get("key") == "region":
+                    location = attr.get("value", "Global")
+                    break
+
+            out[i] = {
+                "provider": "Akash Network",
+                "external_id": g("provider_address", ""),
+                "model": g("gpu_model", "Unknown"),
+                "vram_gb": _int(g("vram_gb", 0)),
+                "price_per_hour": _round(_float(g("price_per_hour", 0)), 4),
+                "available": True,  # Akash shows only available resources
+                "location": location,
+                "g_score": _round(g_score, 2),
+                "specs": {
+                    "provider_type": "decentralized",
+                    "blockchain": "akash",
+                    "host_uri": g("host_uri", ""),
+                    "performance_score": performance,
+                    "reliability_score": reliability,
+                    "persistent_storage": True,
+                    "auto_scaling": False,
+                },
+                "metadata": {
+                    "provider_address": g("provider_address"),
+                    "attributes": attributes,
+                    "pricing_model": "reverse_auction",
+                    "payment_method": "AKT_token",
+                    "deployment_time": "~5-10 minutes",
+                },
+                "last_updated": now_iso,
+            }
 
-        return {
-            "provider": "Akash Network",
-            "external_id": raw_data.get("provider_address", ""),
-            "model": raw_data.get("gpu_model", "Unknown"),
-            "vram_gb": int(raw_data.get("vram_gb", 0)),
-            "price_per_hour": round(float(raw_data.get("price_per_hour", 0)), 4),
-            "available": True,  # Akash shows only available resources
-            "location": location,
-            "g_score": round(g_score, 2),
-            "specs": {
-                "provider_type": "decentralized",
-                "blockchain": "akash",
-                "host_uri": raw_data.get("host_uri", ""),
-                "performance_score": performance,
-                "reliability_score": reliability,
-                "persistent_storage": True,
-                "auto_scaling": False,
-            },
-            "metadata": {
-                "provider_address": raw_data.get("provider_address"),
-                "attributes": attributes,
-                "pricing_model": "reverse_auction",
-                "payment_method": "AKT_token",
-                "deployment_time": "~5-10 minutes",
-            },
-            "last_updated": datetime.utcnow().isoformat(),
-        }
+        return out
 
     async def get_provider_status(self, provider_address: str) -> Dict[str, Any]:
         """
@@ -205,7 +235,7 @@ class AkashProvider(BaseProvider):
             response = await self.client.get(url)
             response.raise_for_status()
 
-            return response.json()
+            return orjson.loads(response.content)
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -269,7 +299,7 @@ class AkashProvider(BaseProvider):
             response = await self.client.get(url, params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get("bids", [])
 
         except Exception as e:
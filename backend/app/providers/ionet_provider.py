@@ -8,6 +8,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 import httpx
+import orjson
 
 from ..core.base_provider import BaseProvider
 from ..core.provider_config import get_provider_config
@@ -15,6 +16,13 @@ from ..core.provider_config import get_provider_config
 
 logger = logging.getLogger(__name__)
 
+# G-Score weights (io.net is AI/ML-focused, so performance dominates);
+# module-level so the hot normalize path reads constants, not literals
+# re-evaluated against a method-local namespace
+_PERF_WEIGHT = 0.5
+_REL_WEIGHT = 0.3
+_EFF_WEIGHT = 0.2
+
 
 class IONetProvider(BaseProvider):
     """
@@ -67,7 +75,9 @@ class IONetProvider(BaseProvider):
             response = await self.client.get(url, params=params)
             response.raise_for_status()
 
-            data = response.json()
+            # Up to 1000 nested device objects: orjson cuts the parse
+            # cost of the dominant payload by severalfold
+            data = orjson.loads(response.content)
 
             # io.net returns {"devices": [...], "total": N}
             devices = data.get("devices", [])
@@ -108,55 +118,84 @@ class IONetProvider(BaseProvider):
         - provider_reputation: Provider reliability score
         - bandwidth_gbps: Network bandwidth
         """
-        # Calculate G-Score
-        # io.net focuses on AI/ML, so prioritize compute capability
-        performance = float(raw_data.get("performance_score", 50)) / 100.0
-        reliability = float(raw_data.get("provider_reputation", 80)) / 100.0
-
-        price = float(raw_data.get("price_per_hour", 1.0))
-        efficiency = 1.0 / (price + 0.1)
-        efficiency = min(efficiency, 1.0)
-
-        g_score = (performance * 0.5 + reliability * 0.3 + efficiency * 0.2) * 100
-
-        # Availability
-        available = raw_data.get("availability") == "available"
-
-        # Boost score for cluster-ready GPUs
-        if raw_data.get("cluster_ready", False):
-            g_score *= 1.1  # 10% boost
-            g_score = min(g_score, 100)  # Cap at 100
-
-        return {
-            "provider": "io.net",
-            "external_id": str(raw_data.get("device_id")),
-            "model": raw_data.get("gpu_model", "Unknown"),
-            "vram_gb": int(raw_data.get("gpu_memory", 0)),
-            "price_per_hour": round(float(raw_data.get("price_per_hour", 0)), 4),
-            "available": available,
-            "location": raw_data.get("location", "Unknown"),
-            "g_score": round(g_score, 2),
-            "specs": {
-                "compute_capability": raw_data.get("compute_capability", "Unknown"),
-                "cuda_cores": int(raw_data.get("cuda_cores", 0)),
-                "tensor_cores": int(raw_data.get("tensor_cores", 0)),
-                "memory_bandwidth_gbps": float(raw_data.get("memory_bandwidth", 0)),
-                "network_bandwidth_gbps": float(raw_data.get("bandwidth_gbps", 0)),
-                "cluster_ready": raw_data.get("cluster_ready", False),
-                "performance_score": performance,
-                "reliability_score": reliability,
-                "max_power_draw": int(raw_data.get("max_power_draw", 0)),
-            },
-            "metadata": {
-                "provider_id": raw_data.get("provider_id"),
-                "provider_reputation": float(raw_data.get("provider_reputation", 0)),
-                "uptime_percentage": float(raw_data.get("uptime_percentage", 0)),
-                "supported_frameworks": raw_data.get("supported_frameworks", []),
-                "container_support": raw_data.get("container_support", False),
-                "bare_metal": raw_data.get("bare_metal", False),
-            },
-            "last_updated": datetime.utcnow().isoformat(),
-        }
+        return self.normalize_many([raw_data])[0]
+
+    def normalize_many(self, raw_gpus: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Bulk-normalize an io.net device batch in a single pass
+
+        Up to 1000 uniform device dicts per fetch makes this the hottest
+        normalize path in the codebase, so it implements the base-class
+        bulk hook directly: the builtins and score weights are bound to
+        locals once per batch rather than looked up per row.
+        """
+        _float = float
+        _int = int
+        _min = min
+        _round = round
+        pw, rw, ew = _PERF_WEIGHT, _REL_WEIGHT, _EFF_WEIGHT
+
+        # last_updated only needs per-batch resolution: one utcnow call
+        # and one isoformat string shared by every row
+        now_iso = datetime.utcnow().isoformat()
+
+        out: List[Dict[str, Any]] = [None] * len(raw_gpus)
+        for i, raw_data in enumerate(raw_gpus):
+            # One local bind of the bound method: g(...) skips a
+            # dict-attribute lookup per field
+            g = raw_data.get
+
+            # Calculate G-Score
+            # io.net focuses on AI/ML, so prioritize compute capability
+            performance = _float(g("performance_score", 50)) / 100.0
+            reliability = _float(g("provider_reputation", 80)) / 100.0
+
+            # Read price once; scoring defaults missing prices to 1.0
+            # while the normalized record reports them as 0
+            raw_price = g("price_per_hour")
+            price = _float(raw_price) if raw_price is not None else 1.0
+            efficiency = _min(1.0 / (price + 0.1), 1.0)
+
+            g_score = (performance * pw + reliability * rw + efficiency * ew) * 100
+
+            # Boost score for cluster-ready GPUs
+            cluster_ready = g("cluster_ready", False)
+            if cluster_ready:
+                g_score *= 1.1  # 10% boost
+                g_score = _min(g_score, 100)  # Cap at 100
+
+            out[i] = {
+                "provider": "io.net",
+                "external_id": str(g("device_id")),
+                "model": g("gpu_model", "Unknown"),
+                "vram_gb": _int(g("gpu_memory", 0)),
+                "price_per_hour": _round(_float(raw_price) if raw_price is not None else 0.0, 4),
+                "available": g("availability") == "available",
+                "location": g("location", "Unknown"),
+                "g_score": _round(g_score, 2),
+                "specs": {
+                    "compute_capability": g("compute_capability", "Unknown"),
+                    "cuda_cores": _int(g("cuda_cores", 0)),
+                    "tensor_cores": _int(g("tensor_cores", 0)),
+                    "memory_bandwidth_gbps": _float(g("memory_bandwidth", 0)),
+                    "network_bandwidth_gbps": _float(g("bandwidth_gbps", 0)),
+                    "cluster_ready": cluster_ready,
+                    "performance_score": performance,
+                    "reliability_score": reliability,
+                    "max_power_draw": _int(g("max_power_draw", 0)),
+                },
+                "metadata": {
+                    "provider_id": g("provider_id"),
+                    "provider_reputation": _float(g("provider_reputation", 0)),
+                    "uptime_percentage": _float(g("uptime_percentage", 0)),
+                    "supported_frameworks": g("supported_frameworks", []),
+                    "container_support": g("container_support", False),
+                    "bare_metal": g("bare_metal", False),
+                },
+                "last_updated": now_iso,
+            }
+
+        return out
 
     async def get_gpu_details(self, gpu_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -173,7 +212,7 @@ class IONetProvider(BaseProvider):
             response = await self.client.get(url)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             return self.normalize_gpu_data(data)
 
         except httpx.HTTPStatusError as e:
@@ -213,10 +252,14 @@ class IONetProvider(BaseProvider):
                 "auto_scaling": False,
             }
 
-            response = await self.client.post(url, json=payload)
+            response = await self.client.post(
+                url,
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+            )
             response.raise_for_status()
 
-            result = response.json()
+            result = orjson.loads(response.content)
 
             logger.info(f"io.net: Created cluster {result.get('cluster_id')}")
 
@@ -253,10 +296,14 @@ class IONetProvider(BaseProvider):
                 "auto_restart": True,
             }
 
-            response = await self.client.post(url, json=payload)
+            response = await self.client.post(
+                url,
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+            )
             response.raise_for_status()
 
-            result = response.json()
+            result = orjson.loads(response.content)
 
             logger.info(f"io.net: Deployed container {result.get('deployment_id')}")
 
@@ -281,7 +328,7 @@ class IONetProvider(BaseProvider):
             response = await self.client.get(url)
             response.raise_for_status()
 
-            return response.json()
+            return orjson.loads(response.content)
 
         except Exception as e:
             logger.error(f"io.net: Error getting cluster status: {str(e)}")
@@ -2,17 +2,27 @@
 Pydantic Schemas
 Request/Response models for API validation
 """
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import (
+    AliasChoices, BaseModel, EmailStr, Field, ConfigDict,
+    field_serializer, field_validator
+)
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional, List
 from uuid import UUID
 from app.models import (
     SkillLevel, ThemePreference, ReservationStatus,
-    ClusterStatus, TransactionType, TransactionStatus
+    ClusterStatus, TransactionType, TransactionStatus, MICRO_USDC
 )
 
 
+def _micro_to_usdc(value):
+    """Convert integer micro-USDC rows to Decimal USDC at the boundary"""
+    if isinstance(value, int):
+        return Decimal(value) / MICRO_USDC
+    return value
+
+
 # User Schemas
 class UserBase(BaseModel):
     email: EmailStr
@@ -60,6 +70,11 @@ class GPU(GPUBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @field_serializer("price_per_hour", "g_score", "uptime_percent")
+    def _decimal_to_float(self, value: Optional[Decimal]) -> Optional[float]:
+        """Serialize Decimal columns as JSON numbers, not strings"""
+        return float(value) if value is not None else None
+
 
 class GPUSearch(BaseModel):
     model: Optional[str] = None
@@ -134,7 +149,10 @@ class Cluster(BaseModel):
 class WalletResponse(BaseModel):
     id: UUID
     user_id: UUID
-    balance_usdc: Decimal
+    # The ORM column is named balance; the API field keeps its name
+    balance_usdc: Decimal = Field(
+        validation_alias=AliasChoices("balance", "balance_usdc")
+    )
     total_earned: Decimal
     total_spent: Decimal
     created_at: datetime
@@ -142,6 +160,10 @@ class WalletResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    _from_micro = field_validator(
+        "balance_usdc", "total_earned", "total_spent", mode="before"
+    )(_micro_to_usdc)
+
 
 class DepositRequest(BaseModel):
     amount: Decimal = Field(gt=0, description="Amount to deposit (must be positive)")
@@ -170,6 +192,15 @@ class TransactionResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    _from_micro = field_validator("amount", "balance_after", mode="before")(
+        _micro_to_usdc
+    )
+
+
+class TransactionHistoryResponse(BaseModel):
+    transactions: List[TransactionResponse]
+    next_cursor: Optional[str] = None
+
 
 class SpendingAnalyticsResponse(BaseModel):
     period_days: int
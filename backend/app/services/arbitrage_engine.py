@@ -19,6 +19,10 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Quantum hoisted to module scope; from_float().quantize() skips the
+# throwaway-string detour of Decimal(str(...))
+_Q2 = Decimal("0.01")
+
 
 class ArbitrageEngine:
     """
@@ -52,7 +56,7 @@ class ArbitrageEngine:
 
         # Check cache first
         if self.redis:
-            cached = await self._get_cached_opportunities(gpu_model)
+            cached = await self._get_cached_opportunities(min_spread, gpu_model)
             if cached:
                 logger.info(f"Returning {len(cached)} cached opportunities")
                 return cached
@@ -62,7 +66,7 @@ class ArbitrageEngine:
 
         # Cache results
         if self.redis and opportunities:
-            await self._cache_opportunities(opportunities, gpu_model)
+            await self._cache_opportunities(opportunities, min_spread, gpu_model)
 
         logger.info(f"Found {len(opportunities)} arbitrage opportunities")
         return opportunities
@@ -119,7 +123,7 @@ class ArbitrageEngine:
                     cheapest_price=cheapest.price_per_hour,
                     expensive_provider=most_expensive.provider,
                     expensive_price=most_expensive.price_per_hour,
-                    spread_pct=Decimal(str(spread_pct)),
+                    spread_pct=Decimal.from_float(spread_pct).quantize(_Q2),
                     savings_per_hour=spread_amount,
                     timestamp=datetime.utcnow()
                 )
@@ -147,13 +151,14 @@ class ArbitrageEngine:
 
     async def _get_cached_opportunities(
         self,
+        min_spread: float,
         gpu_model: Optional[str] = None
     ) -> Optional[List[ArbitrageOpportunity]]:
         """Get opportunities from Redis cache"""
         if not self.redis:
             return None
 
-        cache_key = f"arbitrage:opportunities:{gpu_model or 'all'}"
+        cache_key = f"arbitrage:opportunities:{min_spread}:{gpu_model or 'all'}"
 
         try:
             cached_data = await self.redis.get(cache_key)
@@ -170,13 +175,14 @@ class ArbitrageEngine:
     async def _cache_opportunities(
         self,
         opportunities: List[ArbitrageOpportunity],
+        min_spread: float,
         gpu_model: Optional[str] = None
     ):
         """Cache opportunities in Redis"""
         if not self.redis:
             return
 
-        cache_key = f"arbitrage:opportunities:{gpu_model or 'all'}"
+        cache_key = f"arbitrage:opportunities:{min_spread}:{gpu_model or 'all'}"
 
         try:
             import json
@@ -12,6 +12,7 @@ import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
+from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, status
 
 from app.models import (
@@ -20,6 +21,9 @@ from app.models import (
 
 logger = logging.getLogger(__name__)
 
+# Contribution quantum; from_float().quantize() skips Decimal(str(...))
+_Q4 = Decimal("0.0001")
+
 
 class ClusterOrchestrator:
     """
@@ -72,23 +76,16 @@ class ClusterOrchestrator:
             f"{compute_intensity} TFLOPS, {vram_gb}GB VRAM, {deadline_hours}h deadline"
         )
 
-        # Step 1: Find eligible GPUs
-        eligible_gpus = await self._find_eligible_gpus(vram_gb, self.MIN_G_SCORE)
+        # Step 1: Find eligible GPUs, ranked by G-Score in the database
+        ranked_gpus = await self._find_eligible_gpus(vram_gb, self.MIN_G_SCORE)
 
-        if not eligible_gpus:
+        if not ranked_gpus:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No eligible GPUs available for cluster"
             )
 
-        # Step 2: Rank GPUs by G-Score
-        ranked_gpus = sorted(
-            eligible_gpus,
-            key=lambda gpu: (gpu.g_score or 0, gpu.price_per_hour),
-            reverse=True
-        )
-
-        # Step 3: Form cluster
+        # Step 2: Form cluster
         selected_gpus, total_tflops = await self._select_gpus_for_cluster(
             ranked_gpus,
             compute_intensity,
@@ -102,13 +99,13 @@ class ClusterOrchestrator:
                 detail="Cannot form cluster with available GPUs"
             )
 
-        # Step 4: Calculate total cost
+        # Step 3: Calculate total cost
         total_cost = self._calculate_cluster_cost(
             selected_gpus,
             deadline_hours
         )
 
-        # Step 4.5: Check user has sufficient funds
+        # Step 3.5: Check user has sufficient funds
         from app.services.wallet_service import WalletService
         wallet_service = WalletService(self.db)
         user_balance = await wallet_service.get_balance(user_id)
@@ -119,7 +116,7 @@ class ClusterOrchestrator:
                 detail=f"Insufficient funds: balance={user_balance} USDC, required={total_cost} USDC"
             )
 
-        # Step 5: Create cluster in database
+        # Step 4: Create cluster in database
         cluster = Cluster(
             user_id=user_id,
             job_name=job_name,
@@ -131,7 +128,7 @@ class ClusterOrchestrator:
         self.db.add(cluster)
         await self.db.flush()  # Get cluster ID
 
-        # Step 6: Add cluster members with contribution scores
+        # Step 5: Add cluster members with contribution scores
         await self._add_cluster_members(
             cluster.id,
             selected_gpus,
@@ -259,27 +256,49 @@ class ClusterOrchestrator:
         logger.info(f"Stopped cluster {cluster_id}, success: {success}")
         return cluster
 
-    async def get_cluster_details(self, cluster_id: UUID) -> Dict:
+    async def get_cluster_details(
+        self,
+        cluster_id: UUID,
+        user_id: Optional[UUID] = None
+    ) -> Dict:
         """
         Get detailed information about a cluster including members
 
+        Members and their GPUs are eager-loaded with the cluster, so the
+        whole detail view costs two queries regardless of member count.
+
         Args:
             cluster_id: Cluster ID
+            user_id: If provided, require that this user owns the cluster
 
         Returns:
             Cluster details with member information
-        """
-        cluster = await self._get_cluster(cluster_id)
 
-        # Get cluster members with GPU details
+        Raises:
+            HTTPException: 404 if not found, 403 if not the owner
+        """
         result = await self.db.execute(
-            select(ClusterMember, GPU)
-            .join(GPU, ClusterMember.gpu_id == GPU.id)
-            .where(ClusterMember.cluster_id == cluster_id)
+            select(Cluster)
+            .options(selectinload(Cluster.members).selectinload(ClusterMember.gpu))
+            .where(Cluster.id == cluster_id)
         )
+        cluster = result.scalar_one_or_none()
+
+        if not cluster:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Cluster not found"
+            )
+
+        if user_id is not None and cluster.user_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to view this cluster"
+            )
 
         members_data = []
-        for member, gpu in result:
+        for member in cluster.members:
+            gpu = member.gpu
             members_data.append({
                 'member_id': str(member.id),
                 'gpu_id': str(gpu.id),
@@ -306,7 +325,12 @@ class ClusterOrchestrator:
         min_vram: int,
         min_g_score: float
     ) -> List[GPU]:
-        """Find GPUs eligible for cluster based on criteria"""
+        """
+        Find GPUs eligible for cluster based on criteria
+
+        Rows come back ranked by G-Score (the DPP ranking order), so
+        callers can consume them directly without a Python-side sort.
+        """
         result = await self.db.execute(
             select(GPU).where(
                 and_(
@@ -316,6 +340,7 @@ class ClusterOrchestrator:
                     GPU.last_synced > datetime.utcnow() - timedelta(hours=1)
                 )
             )
+            .order_by(GPU.g_score.desc(), GPU.price_per_hour.desc())
         )
 
         gpus = result.scalars().all()
@@ -422,7 +447,7 @@ class ClusterOrchestrator:
         # Create cluster members
         for perf in gpu_performances:
             gpu = perf['gpu']
-            contribution = Decimal(str(perf['contribution']))
+            contribution = Decimal.from_float(perf['contribution']).quantize(_Q4)
 
             # Calculate earnings based on contribution
             gpu_hours_cost = gpu.price_per_hour * hours
@@ -10,12 +10,17 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 
 from app.models import Reservation, GPU, User, ReservationStatus
 
 logger = logging.getLogger(__name__)
 
+# Duration quantum (0.36s resolution); from_float().quantize() avoids
+# the string round-trip of Decimal(str(...)) on every booking
+_Q4 = Decimal("0.0001")
+
 
 class ReservationService:
     """
@@ -79,7 +84,7 @@ class ReservationService:
 
         # Calculate cost
         duration_hours = (end_time - start_time).total_seconds() / 3600
-        total_cost = gpu.price_per_hour * Decimal(str(duration_hours))
+        total_cost = gpu.price_per_hour * Decimal.from_float(duration_hours).quantize(_Q4)
 
         # Create reservation
         reservation = Reservation(
@@ -92,7 +97,16 @@ class ReservationService:
         )
 
         self.db.add(reservation)
-        await self.db.commit()
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # Lost the race against a concurrent booking; the exclusion
+            # constraint on (gpu_id, period) rejected the insert
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Time slot conflicts with existing reservation"
+            )
         await self.db.refresh(reservation)
 
         logger.info(
@@ -134,11 +148,24 @@ class ReservationService:
 
         return list(reservations)
 
-    async def get_reservation(self, reservation_id: UUID) -> Reservation:
-        """Get reservation by ID"""
-        result = await self.db.execute(
-            select(Reservation).where(Reservation.id == reservation_id)
-        )
+    async def get_reservation(
+        self,
+        reservation_id: UUID,
+        user_id: Optional[UUID] = None
+    ) -> Reservation:
+        """
+        Get reservation by ID
+
+        When user_id is given the ownership check rides in the WHERE
+        clause, so foreign reservation IDs come back as a plain 404
+        instead of leaking their existence through a 403.
+        """
+        query = select(Reservation).where(Reservation.id == reservation_id)
+
+        if user_id is not None:
+            query = query.where(Reservation.user_id == user_id)
+
+        result = await self.db.execute(query)
         reservation = result.scalar_one_or_none()
 
         if not reservation:
@@ -167,14 +194,7 @@ class ReservationService:
         Raises:
             HTTPException: If unauthorized or already started
         """
-        reservation = await self.get_reservation(reservation_id)
-
-        # Check ownership
-        if reservation.user_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to cancel this reservation"
-            )
+        reservation = await self.get_reservation(reservation_id, user_id=user_id)
 
         # Check if already started
         if reservation.start_time < datetime.utcnow():
@@ -276,13 +296,20 @@ class ReservationService:
 
         # Calculate additional cost
         additional_hours = (new_end_time - reservation.end_time).total_seconds() / 3600
-        additional_cost = gpu.price_per_hour * Decimal(str(additional_hours))
+        additional_cost = gpu.price_per_hour * Decimal.from_float(additional_hours).quantize(_Q4)
 
         # Update reservation
         reservation.end_time = new_end_time
         reservation.total_cost += additional_cost
 
-        await self.db.commit()
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Extension conflicts with another reservation"
+            )
         await self.db.refresh(reservation)
 
         logger.info(
@@ -314,53 +341,136 @@ class ReservationService:
         day_end = day_start + timedelta(days=1)
 
         # Get all reservations for this GPU on this day
+        reservations = await self._get_overlapping_reservations(
+            gpu_id, day_start, day_end
+        )
+
+        return self._build_slots(reservations, day_start, day_end, slot_duration_hours)
+
+    async def get_calendar(
+        self,
+        gpu_id: UUID,
+        start_date: datetime,
+        days: int,
+        slot_duration_hours: int = 1
+    ) -> List[dict]:
+        """
+        Get daily availability for a GPU over a date range
+
+        Fetches every reservation overlapping the whole range in one
+        query, then buckets slots per day in Python, instead of issuing
+        one query per day.
+
+        Args:
+            gpu_id: GPU to get calendar for
+            start_date: First day of the range (time portion ignored)
+            days: Number of days to include
+            slot_duration_hours: Duration of each slot in hours
+
+        Returns:
+            List of daily entries with available slots
+        """
+        range_start = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        range_end = range_start + timedelta(days=days)
+
+        reservations = await self._get_overlapping_reservations(
+            gpu_id, range_start, range_end
+        )
+
+        calendar = []
+        day_start = range_start
+        for _ in range(days):
+            day_end = day_start + timedelta(days=1)
+            day_reservations = [
+                r for r in reservations
+                if r.start_time < day_end and r.end_time > day_start
+            ]
+            slots = self._build_slots(
+                day_reservations, day_start, day_end, slot_duration_hours
+            )
+            calendar.append({
+                'date': day_start.date().isoformat(),
+                'total_hours_available': len([s for s in slots if s['available']]),
+                'slots': slots
+            })
+            day_start = day_end
+
+        return calendar
+
+    async def _get_overlapping_reservations(
+        self,
+        gpu_id: UUID,
+        range_start: datetime,
+        range_end: datetime
+    ) -> List[Reservation]:
+        """Get pending/active reservations overlapping a time range"""
         result = await self.db.execute(
             select(Reservation).where(
                 and_(
                     Reservation.gpu_id == gpu_id,
                     Reservation.status.in_([ReservationStatus.PENDING, ReservationStatus.ACTIVE]),
-                    or_(
-                        and_(
-                            Reservation.start_time >= day_start,
-                            Reservation.start_time < day_end
-                        ),
-                        and_(
-                            Reservation.end_time > day_start,
-                            Reservation.end_time <= day_end
-                        ),
-                        and_(
-                            Reservation.start_time < day_start,
-                            Reservation.end_time > day_end
-                        )
-                    )
+                    Reservation.start_time < range_end,
+                    Reservation.end_time > range_start
                 )
             )
+            .order_by(Reservation.start_time)
         )
-        reservations = result.scalars().all()
+        return list(result.scalars().all())
+
+    def _build_slots(
+        self,
+        reservations: List[Reservation],
+        day_start: datetime,
+        day_end: datetime,
+        slot_duration_hours: int
+    ) -> List[dict]:
+        """
+        Generate available slots for one day against its reservations
+
+        Sweeps a sorted event list (reservation starts +1, ends -1) into
+        merged busy windows, then walks the day's slots against those
+        windows in a single linear pass instead of checking every slot
+        against every reservation.
+        """
+        # Merge reservations into disjoint busy windows
+        events = []
+        for reservation in reservations:
+            events.append((reservation.start_time, 1))
+            events.append((reservation.end_time, -1))
+        events.sort()
+
+        busy_windows = []
+        open_count = 0
+        window_start = None
+        for timestamp, delta in events:
+            if open_count == 0 and delta > 0:
+                window_start = timestamp
+            open_count += delta
+            if open_count == 0:
+                busy_windows.append((window_start, timestamp))
 
-        # Generate all possible slots
         slots = []
+        slot_duration = timedelta(hours=slot_duration_hours)
         current_time = max(day_start, datetime.utcnow())
+        window_idx = 0
 
         while current_time < day_end:
-            slot_end = current_time + timedelta(hours=slot_duration_hours)
+            slot_end = current_time + slot_duration
 
-            # Check if slot conflicts with any reservation
-            is_available = True
-            for reservation in reservations:
-                if (current_time < reservation.end_time and
-                    slot_end > reservation.start_time):
-                    is_available = False
-                    break
+            # Advance past busy windows that ended before this slot
+            while (window_idx < len(busy_windows) and
+                   busy_windows[window_idx][1] <= current_time):
+                window_idx += 1
 
-            if is_available and current_time >= datetime.utcnow():
+            if (window_idx >= len(busy_windows) or
+                    slot_end <= busy_windows[window_idx][0]):
                 slots.append({
                     'start_time': current_time.isoformat(),
                     'end_time': slot_end.isoformat(),
                     'available': True
                 })
 
-            current_time += timedelta(hours=slot_duration_hours)
+            current_time = slot_end
 
         return slots
 
@@ -398,37 +508,23 @@ class ReservationService:
         Returns:
             True if conflict exists, False otherwise
         """
-        query = select(Reservation).where(
+        # Single half-open overlap predicate, satisfiable by the GiST
+        # exclusion index on (gpu_id, period)
+        query = select(Reservation.id).where(
             and_(
                 Reservation.gpu_id == gpu_id,
                 Reservation.status.in_([ReservationStatus.PENDING, ReservationStatus.ACTIVE]),
-                or_(
-                    # New reservation starts during existing reservation
-                    and_(
-                        Reservation.start_time <= start_time,
-                        Reservation.end_time > start_time
-                    ),
-                    # New reservation ends during existing reservation
-                    and_(
-                        Reservation.start_time < end_time,
-                        Reservation.end_time >= end_time
-                    ),
-                    # New reservation completely contains existing reservation
-                    and_(
-                        start_time <= Reservation.start_time,
-                        end_time >= Reservation.end_time
-                    )
-                )
+                Reservation.start_time < end_time,
+                Reservation.end_time > start_time
             )
-        )
+        ).limit(1)
 
         if exclude_reservation_id:
             query = query.where(Reservation.id != exclude_reservation_id)
 
         result = await self.db.execute(query)
-        conflicts = result.scalars().first()
 
-        return conflicts is not None
+        return result.scalar_one_or_none() is not None
 
     async def activate_pending_reservations(self) -> int:
         """
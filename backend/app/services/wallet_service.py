@@ -10,29 +10,97 @@ Features:
 - Transaction history and analytics
 """
 
+import base64
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from uuid import UUID
 import logging
 
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, update, and_, or_, func, true, tuple_, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import (
     Wallet, Transaction, TransactionType, User, Reservation,
-    ReservationStatus, Cluster, ClusterStatus, ClusterMember, GPU
+    ReservationStatus, Cluster, ClusterStatus, ClusterMember, GPU,
+    MICRO_USDC
 )
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+_spending_analytics_stmt = None
+
+
+def _get_spending_analytics_stmt():
+    """
+    Build the combined wallet + spending aggregate statement once
+
+    Fetches the wallet row and its per-type spending breakdown in a
+    single round-trip: the GROUP BY runs as a LATERAL subquery against
+    the wallet/type/created_at index; only bind parameters change per
+    call.
+    """
+    global _spending_analytics_stmt
+    if _spending_analytics_stmt is None:
+        breakdown = (
+            select(
+                Transaction.type,
+                func.sum(Transaction.amount).label('total'),
+                func.count(Transaction.id).label('count')
+            )
+            .where(
+                and_(
+                    Transaction.wallet_id == Wallet.id,
+                    Transaction.created_at >= bindparam("since_date"),
+                    Transaction.type.in_([
+                        TransactionType.RESERVATION_PAYMENT,
+                        TransactionType.CLUSTER_PAYMENT
+                    ])
+                )
+            )
+            .group_by(Transaction.type)
+            .lateral("spending")
+        )
+        _spending_analytics_stmt = (
+            select(Wallet, breakdown.c.type, breakdown.c.total, breakdown.c.count)
+            .outerjoin(breakdown, true())
+            .where(Wallet.user_id == bindparam("user_id"))
+        )
+    return _spending_analytics_stmt
+
 
 class InsufficientFundsError(Exception):
     """Raised when wallet has insufficient balance"""
     pass
 
 
+def to_micro_usdc(amount: Decimal) -> int:
+    """Convert a Decimal USDC amount to integer micro-USDC"""
+    return int(amount * MICRO_USDC)
+
+
+def from_micro_usdc(amount: int) -> Decimal:
+    """Convert integer micro-USDC back to a Decimal USDC amount"""
+    return Decimal(amount) / MICRO_USDC
+
+
+def _encode_cursor(created_at: datetime, transaction_id: UUID) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor"""
+    raw = f"{created_at.isoformat()}|{transaction_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode an opaque cursor back into its (created_at, id) position"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, _, transaction_id = raw.partition("|")
+        return datetime.fromisoformat(timestamp), UUID(transaction_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid pagination cursor")
+
+
 class WalletService:
     """Service for managing wallet operations and transactions"""
 
@@ -46,12 +114,12 @@ class WalletService:
         wallet = result.scalar_one_or_none()
 
         if not wallet:
-            # Create wallet if it doesn't exist
+            # Create wallet if it doesn't exist (balances in micro-USDC)
             wallet = Wallet(
                 user_id=user_id,
-                balance_usdc=Decimal("0.00"),
-                total_earned=Decimal("0.00"),
-                total_spent=Decimal("0.00")
+                balance=0,
+                total_earned=0,
+                total_spent=0
             )
             self.db.add(wallet)
             await self.db.commit()
@@ -61,9 +129,9 @@ class WalletService:
         return wallet
 
     async def get_balance(self, user_id: UUID) -> Decimal:
-        """Get current wallet balance"""
+        """Get current wallet balance in USDC"""
         wallet = await self.get_wallet(user_id)
-        return wallet.balance_usdc
+        return from_micro_usdc(wallet.balance)
 
     async def deposit(
         self,
@@ -87,28 +155,44 @@ class WalletService:
         if amount <= 0:
             raise ValueError("Deposit amount must be positive")
 
-        wallet = await self.get_wallet(user_id)
+        amount_micro = to_micro_usdc(amount)
+
+        # Credit the balance atomically in one statement; no
+        # read-modify-write window between concurrent deposits
+        credit_stmt = (
+            update(Wallet)
+            .where(Wallet.user_id == user_id)
+            .values(
+                balance=Wallet.balance + amount_micro,
+                updated_at=func.now()
+            )
+            .returning(Wallet.id, Wallet.balance)
+        )
+        row = (await self.db.execute(credit_stmt)).one_or_none()
+
+        if row is None:
+            # First deposit for this user; create the wallet then retry
+            await self.get_wallet(user_id)
+            row = (await self.db.execute(credit_stmt)).one()
+
+        wallet_id, new_balance = row
 
         # Create transaction record
         transaction = Transaction(
-            wallet_id=wallet.id,
+            wallet_id=wallet_id,
             type=TransactionType.DEPOSIT,
-            amount=amount,
-            balance_after=wallet.balance_usdc + amount,
+            amount=amount_micro,
+            balance_after=new_balance,
             description=f"Deposit of {amount} USDC",
             transaction_hash=transaction_hash,
             metadata=metadata or {}
         )
 
-        # Update wallet balance
-        wallet.balance_usdc += amount
-        wallet.updated_at = datetime.utcnow()
-
         self.db.add(transaction)
         await self.db.commit()
         await self.db.refresh(transaction)
 
-        logger.info(f"Deposited {amount} USDC to wallet {wallet.id}")
+        logger.info(f"Deposited {amount} USDC to wallet {wallet_id}")
         return transaction
 
     async def withdraw(
@@ -136,37 +220,51 @@ class WalletService:
         if amount <= 0:
             raise ValueError("Withdrawal amount must be positive")
 
-        wallet = await self.get_wallet(user_id)
+        amount_micro = to_micro_usdc(amount)
 
-        # Check sufficient funds
-        if wallet.balance_usdc < amount:
+        # Debit atomically; the balance guard rides in the WHERE clause
+        # so overdrafts lose the race at the row level, not in Python
+        debit_stmt = (
+            update(Wallet)
+            .where(
+                Wallet.user_id == user_id,
+                Wallet.balance >= amount_micro
+            )
+            .values(
+                balance=Wallet.balance - amount_micro,
+                updated_at=func.now()
+            )
+            .returning(Wallet.id, Wallet.balance)
+        )
+        row = (await self.db.execute(debit_stmt)).one_or_none()
+
+        if row is None:
+            await self.db.rollback()
             raise InsufficientFundsError(
-                f"Insufficient funds: balance={wallet.balance_usdc}, requested={amount}"
+                f"Insufficient funds for withdrawal of {amount} USDC"
             )
 
+        wallet_id, new_balance = row
+
         # Create transaction record
         transaction_metadata = metadata or {}
         if destination_address:
             transaction_metadata["destination_address"] = destination_address
 
         transaction = Transaction(
-            wallet_id=wallet.id,
+            wallet_id=wallet_id,
             type=TransactionType.WITHDRAWAL,
-            amount=amount,
-            balance_after=wallet.balance_usdc - amount,
+            amount=amount_micro,
+            balance_after=new_balance,
             description=f"Withdrawal of {amount} USDC",
             metadata=transaction_metadata
         )
 
-        # Update wallet balance
-        wallet.balance_usdc -= amount
-        wallet.updated_at = datetime.utcnow()
-
         self.db.add(transaction)
         await self.db.commit()
         await self.db.refresh(transaction)
 
-        logger.info(f"Withdrew {amount} USDC from wallet {wallet.id}")
+        logger.info(f"Withdrew {amount} USDC from wallet {wallet_id}")
         return transaction
 
     async def process_reservation_payment(
@@ -185,27 +283,29 @@ class WalletService:
             raise ValueError("Payment amount must be positive")
 
         wallet = await self.get_wallet(user_id)
+        amount_micro = to_micro_usdc(amount)
 
         # Check sufficient funds
-        if wallet.balance_usdc < amount:
+        if wallet.balance < amount_micro:
             raise InsufficientFundsError(
-                f"Insufficient funds for reservation: balance={wallet.balance_usdc}, cost={amount}"
+                f"Insufficient funds for reservation: "
+                f"balance={from_micro_usdc(wallet.balance)}, cost={amount}"
             )
 
         # Create transaction
         transaction = Transaction(
             wallet_id=wallet.id,
             type=TransactionType.RESERVATION_PAYMENT,
-            amount=amount,
-            balance_after=wallet.balance_usdc - amount,
+            amount=amount_micro,
+            balance_after=wallet.balance - amount_micro,
             reservation_id=reservation_id,
             description=f"Payment for reservation {reservation_id}",
             metadata={"reservation_id": str(reservation_id)}
         )
 
         # Update wallet
-        wallet.balance_usdc -= amount
-        wallet.total_spent += amount
+        wallet.balance -= amount_micro
+        wallet.total_spent += amount_micro
         wallet.updated_at = datetime.utcnow()
 
         self.db.add(transaction)
@@ -230,20 +330,21 @@ class WalletService:
             raise ValueError("Refund amount must be positive")
 
         wallet = await self.get_wallet(user_id)
+        amount_micro = to_micro_usdc(amount)
 
         # Create refund transaction
         transaction = Transaction(
             wallet_id=wallet.id,
             type=TransactionType.RESERVATION_REFUND,
-            amount=amount,
-            balance_after=wallet.balance_usdc + amount,
+            amount=amount_micro,
+            balance_after=wallet.balance + amount_micro,
             reservation_id=reservation_id,
             description=f"Refund for cancelled reservation {reservation_id}",
             metadata={"reservation_id": str(reservation_id)}
         )
 
         # Update wallet
-        wallet.balance_usdc += amount
+        wallet.balance += amount_micro
         wallet.updated_at = datetime.utcnow()
 
         self.db.add(transaction)
@@ -268,27 +369,29 @@ class WalletService:
             raise ValueError("Payment amount must be positive")
 
         wallet = await self.get_wallet(user_id)
+        amount_micro = to_micro_usdc(amount)
 
         # Check sufficient funds
-        if wallet.balance_usdc < amount:
+        if wallet.balance < amount_micro:
             raise InsufficientFundsError(
-                f"Insufficient funds for cluster: balance={wallet.balance_usdc}, cost={amount}"
+                f"Insufficient funds for cluster: "
+                f"balance={from_micro_usdc(wallet.balance)}, cost={amount}"
             )
 
         # Create transaction
         transaction = Transaction(
             wallet_id=wallet.id,
             type=TransactionType.CLUSTER_PAYMENT,
-            amount=amount,
-            balance_after=wallet.balance_usdc - amount,
+            amount=amount_micro,
+            balance_after=wallet.balance - amount_micro,
             cluster_id=cluster_id,
             description=f"Payment for cluster {cluster_id}",
             metadata={"cluster_id": str(cluster_id)}
         )
 
         # Update wallet
-        wallet.balance_usdc -= amount
-        wallet.total_spent += amount
+        wallet.balance -= amount_micro
+        wallet.total_spent += amount_micro
         wallet.updated_at = datetime.utcnow()
 
         self.db.add(transaction)
@@ -337,6 +440,7 @@ class WalletService:
         for member, gpu in members:
             # Calculate earnings based on contribution score
             earnings = cluster.total_cost * member.contribution_score
+            earnings_micro = to_micro_usdc(earnings)
 
             # Get GPU owner's wallet
             owner_wallet = await self.get_wallet(gpu.provider_user_id)
@@ -345,8 +449,8 @@ class WalletService:
             transaction = Transaction(
                 wallet_id=owner_wallet.id,
                 type=TransactionType.CLUSTER_EARNINGS,
-                amount=earnings,
-                balance_after=owner_wallet.balance_usdc + earnings,
+                amount=earnings_micro,
+                balance_after=owner_wallet.balance + earnings_micro,
                 cluster_id=cluster_id,
                 description=f"Earnings from cluster {cluster_id} (contribution: {member.contribution_score:.2%})",
                 metadata={
@@ -357,8 +461,8 @@ class WalletService:
             )
 
             # Update wallet
-            owner_wallet.balance_usdc += earnings
-            owner_wallet.total_earned += earnings
+            owner_wallet.balance += earnings_micro
+            owner_wallet.total_earned += earnings_micro
             owner_wallet.updated_at = datetime.utcnow()
 
             self.db.add(transaction)
@@ -383,21 +487,49 @@ class WalletService:
         self,
         user_id: UUID,
         limit: int = 50,
-        offset: int = 0,
+        cursor: Optional[str] = None,
         transaction_type: Optional[TransactionType] = None
-    ) -> List[Transaction]:
-        """Get transaction history for a user"""
-        wallet = await self.get_wallet(user_id)
+    ) -> Tuple[List[Transaction], Optional[str]]:
+        """
+        Get a page of transaction history for a user
+
+        Uses keyset pagination on (created_at, id) instead of OFFSET, so
+        deep pages stay an index range scan rather than a scan-and-skip.
 
-        stmt = select(Transaction).where(Transaction.wallet_id == wallet.id)
+        Returns:
+            Page of transactions plus the cursor for the next page
+            (None when this is the last page)
+        """
+        # Join through Wallet instead of resolving the wallet first, so
+        # history is one query instead of two round-trips
+        stmt = (
+            select(Transaction)
+            .join(Wallet, Transaction.wallet_id == Wallet.id)
+            .where(Wallet.user_id == user_id)
+        )
 
         if transaction_type:
             stmt = stmt.where(Transaction.type == transaction_type)
 
-        stmt = stmt.order_by(Transaction.created_at.desc()).limit(limit).offset(offset)
+        if cursor:
+            cursor_time, cursor_id = _decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(Transaction.created_at, Transaction.id) < (cursor_time, cursor_id)
+            )
+
+        stmt = stmt.order_by(
+            Transaction.created_at.desc(), Transaction.id.desc()
+        ).limit(limit)
 
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        transactions = list(result.scalars().all())
+
+        next_cursor = None
+        if len(transactions) == limit:
+            last = transactions[-1]
+            next_cursor = _encode_cursor(last.created_at, last.id)
+
+        return transactions, next_cursor
 
     async def get_spending_analytics(
         self,
@@ -410,31 +542,27 @@ class WalletService:
         Returns:
             Dictionary with spending breakdown by category
         """
-        wallet = await self.get_wallet(user_id)
         since_date = datetime.utcnow() - timedelta(days=days)
 
-        # Get spending by type
-        stmt = (
-            select(
-                Transaction.type,
-                func.sum(Transaction.amount).label('total'),
-                func.count(Transaction.id).label('count')
-            )
-            .where(
-                and_(
-                    Transaction.wallet_id == wallet.id,
-                    Transaction.created_at >= since_date,
-                    Transaction.type.in_([
-                        TransactionType.RESERVATION_PAYMENT,
-                        TransactionType.CLUSTER_PAYMENT
-                    ])
-                )
-            )
-            .group_by(Transaction.type)
+        # Wallet row and spending breakdown in one round-trip
+        result = await self.db.execute(
+            _get_spending_analytics_stmt(),
+            {"user_id": user_id, "since_date": since_date}
         )
-
-        result = await self.db.execute(stmt)
-        spending_breakdown = {row.type: {"total": row.total, "count": row.count} for row in result}
+        rows = result.all()
+
+        if rows:
+            wallet = rows[0].Wallet
+        else:
+            # No wallet yet; create it and report an empty period
+            wallet = await self.get_wallet(user_id)
+
+        # Sums come back as micro-USDC integers; convert at the boundary
+        spending_breakdown = {
+            row.type: {"total": from_micro_usdc(row.total), "count": row.count}
+            for row in rows
+            if row.type is not None
+        }
 
         # Calculate totals
         total_spent = sum(item["total"] for item in spending_breakdown.values())
@@ -445,7 +573,7 @@ class WalletService:
             "total_spent": total_spent,
             "total_transactions": total_transactions,
             "breakdown": spending_breakdown,
-            "current_balance": wallet.balance_usdc,
-            "lifetime_spent": wallet.total_spent,
-            "lifetime_earned": wallet.total_earned
+            "current_balance": from_micro_usdc(wallet.balance),
+            "lifetime_spent": from_micro_usdc(wallet.total_spent),
+            "lifetime_earned": from_micro_usdc(wallet.total_earned)
         }
@@ -129,10 +129,13 @@ class TestWalletAPI:
         assert response.status_code == 200
         data = response.json()
 
-        assert isinstance(data, list)
-        assert len(data) > 0
-        assert data[0]["type"] == "DEPOSIT"
-        assert Decimal(data[0]["amount"]) == Decimal("250.00")
+        transactions = data["transactions"]
+        assert isinstance(transactions, list)
+        assert len(transactions) > 0
+        assert transactions[0]["type"] == "DEPOSIT"
+        assert Decimal(transactions[0]["amount"]) == Decimal("250.00")
+        # Fewer rows than the page size, so there is no next page
+        assert data["next_cursor"] is None
 
     async def test_get_transaction_history_with_filter(
         self,
@@ -161,7 +164,7 @@ class TestWalletAPI:
         assert response.status_code == 200
         data = response.json()
 
-        assert all(tx["type"] == "DEPOSIT" for tx in data)
+        assert all(tx["type"] == "DEPOSIT" for tx in data["transactions"])
 
     async def test_get_spending_analytics(
         self,
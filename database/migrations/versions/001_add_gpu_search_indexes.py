@@ -0,0 +1,36 @@
+"""Add indexes backing the GPU search hot filters
+
+Revision ID: 001
+Revises:
+Create Date: 2026-08-31
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial index: available-GPU searches return pre-sorted by price
+    op.create_index(
+        "ix_gpus_available_price",
+        "gpus",
+        ["price_per_hour"],
+        postgresql_where=sa.text("available = true"),
+    )
+    # Composite index for the last_synced freshness filter + price ordering
+    op.create_index(
+        "ix_gpus_sync_price",
+        "gpus",
+        ["last_synced", "price_per_hour"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_gpus_sync_price", table_name="gpus")
+    op.drop_index("ix_gpus_available_price", table_name="gpus")
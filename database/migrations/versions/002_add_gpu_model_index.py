@@ -0,0 +1,29 @@
+"""Add partial model index for distinct-model listings
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-08-31
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Distinct available models can be answered from an index-only scan
+    op.create_index(
+        "ix_gpus_model_available",
+        "gpus",
+        ["model"],
+        postgresql_where=sa.text("available = true"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_gpus_model_available", table_name="gpus")
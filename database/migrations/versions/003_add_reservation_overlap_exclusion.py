@@ -0,0 +1,40 @@
+"""Enforce reservation overlap exclusion in Postgres
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-08-31
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "003"
+down_revision = "002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # btree_gist lets the GiST exclusion constraint include the uuid column
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # Generated range column over the booked window; '[)' matches the
+    # half-open overlap semantics used by the service layer
+    op.execute(
+        "ALTER TABLE reservations ADD COLUMN period tstzrange "
+        "GENERATED ALWAYS AS (tstzrange(start_time, end_time, '[)')) STORED"
+    )
+
+    # Reject overlapping pending/active bookings for the same GPU at the
+    # index level, closing the read-then-write race in conflict checks
+    op.execute(
+        "ALTER TABLE reservations ADD CONSTRAINT no_reservation_overlap "
+        "EXCLUDE USING gist (gpu_id WITH =, period WITH &&) "
+        "WHERE (status IN ('PENDING', 'ACTIVE'))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE reservations DROP CONSTRAINT no_reservation_overlap")
+    op.execute("ALTER TABLE reservations DROP COLUMN period")
@@ -0,0 +1,44 @@
+"""Add indexes backing wallet transaction history and hash idempotency
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-08-31
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite index so history pages avoid a sort
+    op.create_index(
+        "ix_transactions_wallet_created",
+        "transactions",
+        ["wallet_id", "created_at"],
+    )
+    # Same, for pages filtered by transaction type
+    op.create_index(
+        "ix_transactions_wallet_type_created",
+        "transactions",
+        ["wallet_id", "type", "created_at"],
+    )
+    # Unique partial index backing blockchain-hash idempotency checks
+    op.create_index(
+        "ux_transactions_tx_hash",
+        "transactions",
+        ["tx_hash"],
+        unique=True,
+        postgresql_where=sa.text("tx_hash IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_transactions_tx_hash", table_name="transactions")
+    op.drop_index("ix_transactions_wallet_type_created", table_name="transactions")
+    op.drop_index("ix_transactions_wallet_created", table_name="transactions")
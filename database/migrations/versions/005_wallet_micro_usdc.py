@@ -0,0 +1,38 @@
+"""Store wallet money as integer micro-USDC
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-08-31
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 1 USDC = 1_000_000 micro-units; BIGINT keeps balance math integer
+    op.execute(
+        "ALTER TABLE wallets ALTER COLUMN balance TYPE BIGINT "
+        "USING (balance * 1000000)::bigint"
+    )
+    op.execute(
+        "ALTER TABLE transactions ALTER COLUMN amount TYPE BIGINT "
+        "USING (amount * 1000000)::bigint"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE transactions ALTER COLUMN amount TYPE NUMERIC(20, 8) "
+        "USING amount::numeric / 1000000"
+    )
+    op.execute(
+        "ALTER TABLE wallets ALTER COLUMN balance TYPE NUMERIC(20, 8) "
+        "USING balance::numeric / 1000000"
+    )
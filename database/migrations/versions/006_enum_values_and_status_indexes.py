@@ -0,0 +1,76 @@
+"""Store enum values instead of member names and add status partial indexes
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-08-31
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+
+# Existing databases hold the uppercase Python member names; the models
+# now bind the lowercase values, so every label is renamed in place.
+# RENAME VALUE rewrites only the catalog label — stored rows and any
+# constraint referencing the label (e.g. no_reservation_overlap) keep
+# working because they reference the enum internally, not the text.
+_ENUM_RENAMES = {
+    "skilllevel": ["BEGINNER", "INTERMEDIATE", "EXPERT"],
+    "themepreference": [
+        "PROFESSIONAL", "GAMING", "CREATIVE", "DEVELOPER",
+        "MINIMAL", "CORPORATE", "ACADEMIC",
+    ],
+    "reservationstatus": ["PENDING", "ACTIVE", "COMPLETED", "CANCELLED"],
+    "clusterstatus": ["PENDING", "ACTIVE", "COMPLETED", "FAILED"],
+    "transactiontype": ["DEPOSIT", "WITHDRAWAL", "PAYMENT", "REFUND", "EARNING"],
+    "transactionstatus": ["PENDING", "COMPLETED", "FAILED"],
+}
+
+
+def upgrade() -> None:
+    for type_name, labels in _ENUM_RENAMES.items():
+        for label in labels:
+            op.execute(
+                f"ALTER TYPE {type_name} RENAME VALUE '{label}' TO '{label.lower()}'"
+            )
+
+    # Partial index covering conflict checks and activation sweeps,
+    # which only ever look at open (pending/active) bookings
+    op.create_index(
+        "ix_reservations_gpu_open",
+        "reservations",
+        ["gpu_id", "start_time"],
+        postgresql_where=sa.text("status IN ('pending', 'active')"),
+    )
+    # Same restriction for per-user open-reservation listings
+    op.create_index(
+        "ix_reservations_user_open",
+        "reservations",
+        ["user_id"],
+        postgresql_where=sa.text("status IN ('pending', 'active')"),
+    )
+    # Partial index for the common "my running clusters" listing
+    op.create_index(
+        "ix_clusters_user_active",
+        "clusters",
+        ["user_id"],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_clusters_user_active", table_name="clusters")
+    op.drop_index("ix_reservations_user_open", table_name="reservations")
+    op.drop_index("ix_reservations_gpu_open", table_name="reservations")
+
+    for type_name, labels in _ENUM_RENAMES.items():
+        for label in labels:
+            op.execute(
+                f"ALTER TYPE {type_name} RENAME VALUE '{label.lower()}' TO '{label}'"
+            )
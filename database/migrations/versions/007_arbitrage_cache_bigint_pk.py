@@ -0,0 +1,34 @@
+"""Switch arbitrage_cache to a bigint identity primary key
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-08-31
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # arbitrage_cache is append-only and its rows are never referenced
+    # by id, so the random-UUID key only bloated the PK B-tree; replace
+    # it wholesale with a dense 8-byte identity column
+    op.execute("ALTER TABLE arbitrage_cache DROP COLUMN id")
+    op.execute(
+        "ALTER TABLE arbitrage_cache "
+        "ADD COLUMN id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE arbitrage_cache DROP COLUMN id")
+    op.execute(
+        "ALTER TABLE arbitrage_cache "
+        "ADD COLUMN id UUID PRIMARY KEY DEFAULT gen_random_uuid()"
+    )
@@ -0,0 +1,38 @@
+"""Add composite indexes for the arbitrage and GPU fetch hot paths
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-08-31
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite index so per-type time-series reads hit one index
+    # instead of combining the single-column ones
+    op.create_index(
+        "ix_arbitrage_type_time",
+        "arbitrage_cache",
+        ["gpu_type", "timestamp"],
+    )
+    # Partial composite matching the arbitrage fetch exactly:
+    # available rows filtered by model and sync freshness
+    op.create_index(
+        "ix_gpus_model_synced_available",
+        "gpus",
+        ["model", "last_synced"],
+        postgresql_where=sa.text("available = true"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_gpus_model_synced_available", table_name="gpus")
+    op.drop_index("ix_arbitrage_type_time", table_name="arbitrage_cache")
@@ -0,0 +1,41 @@
+"""Store GPU/reservation/arbitrage prices as bigint micro-USDC
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-08-31
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs moving from numeric(10,2) USDC to bigint
+# micro-USDC; the models read them back as Decimal via MoneyUSDC
+_MONEY_COLUMNS = (
+    ("gpus", "price_per_hour"),
+    ("reservations", "total_cost"),
+    ("arbitrage_cache", "cheapest_price"),
+    ("arbitrage_cache", "expensive_price"),
+)
+
+
+def upgrade() -> None:
+    for table, column in _MONEY_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE BIGINT "
+            f"USING round({column} * 1000000)"
+        )
+
+
+def downgrade() -> None:
+    for table, column in _MONEY_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE NUMERIC(10, 2) "
+            f"USING ({column} / 1000000.0)"
+        )
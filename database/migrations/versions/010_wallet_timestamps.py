@@ -0,0 +1,43 @@
+"""Add created_at/updated_at timestamps to wallets
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-08-31
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # updated_at backs the ETag on /wallets/balance; created_at brings
+    # wallets in line with every other table
+    op.add_column(
+        "wallets",
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "wallets",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("wallets", "updated_at")
+    op.drop_column("wallets", "created_at")
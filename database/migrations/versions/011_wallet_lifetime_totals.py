@@ -0,0 +1,43 @@
+"""Add lifetime earned/spent totals to wallets
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-08-31
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lifetime totals in micro-USDC, kept alongside balance so the
+    # wallet service and spending analytics read real columns
+    op.add_column(
+        "wallets",
+        sa.Column(
+            "total_earned",
+            sa.BigInteger(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "wallets",
+        sa.Column(
+            "total_spent",
+            sa.BigInteger(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("wallets", "total_spent")
+    op.drop_column("wallets", "total_earned")
@@ -100,55 +100,71 @@ class GP4UEngine:
         self._display_summary(gpus, opportunities)
     
     def _display_summary(self, gpus: List, opportunities: List):
-        """Display cycle summary"""
-        print(f"\n{'='*80}")
-        print(f"📊 GP4U REFRESH SUMMARY - {datetime.now().strftime('%H:%M:%S')}")
-        print(f"{'='*80}")
-        
+        """Log cycle summary as a single buffered record"""
+        lines = [
+            "",
+            "=" * 80,
+            f"📊 GP4U REFRESH SUMMARY - {datetime.now().strftime('%H:%M:%S')}",
+            "=" * 80,
+        ]
+
         # Provider breakdown
         network_stats = self.aggregator.get_network_stats(gpus)
-        print("\n🌐 Network Summary:")
+        lines.append("🌐 Network Summary:")
         for provider, stats in network_stats.items():
-            print(f"  {provider}: {stats['count']} GPUs | "
-                  f"${stats['min_price']:.2f} - ${stats['max_price']:.2f}/hr")
-        
+            lines.append(
+                f"  {provider}: {stats['count']} GPUs | "
+                f"${stats['min_price']:.2f} - ${stats['max_price']:.2f}/hr"
+            )
+
         # Best deals
         available_gpus = [g for g in gpus if g.availability == 'Available']
         if available_gpus:
             cheapest = min(available_gpus, key=lambda x: x.total_price)
-            print(f"\n💰 Best Deal: {cheapest.gpu_model} on {cheapest.provider}")
-            print(f"   ${cheapest.total_price:.2f}/hr (Base: ${cheapest.price_per_hour:.2f} + Fees: ${cheapest.provider_fee + cheapest.gp4u_fee:.2f})")
-        
+            lines.append(f"💰 Best Deal: {cheapest.gpu_model} on {cheapest.provider}")
+            lines.append(
+                f"   ${cheapest.total_price:.2f}/hr (Base: ${cheapest.price_per_hour:.2f} "
+                f"+ Fees: ${cheapest.provider_fee + cheapest.gp4u_fee:.2f})"
+            )
+
         # Top arbitrage
         if opportunities:
             best = opportunities[0]
-            print(f"\n📈 Top Arbitrage: {best.gpu_model}")
-            print(f"   {best.cheapest_provider}: ${best.cheapest_price:.2f}/hr")
-            print(f"   {best.expensive_provider}: ${best.expensive_price:.2f}/hr")
-            print(f"   💵 Save {best.savings_percent:.1f}% (${best.savings_amount:.2f}/hr)")
-        
-        print(f"\n{'='*80}\n")
+            lines.append(f"📈 Top Arbitrage: {best.gpu_model}")
+            lines.append(f"   {best.cheapest_provider}: ${best.cheapest_price:.2f}/hr")
+            lines.append(f"   {best.expensive_provider}: ${best.expensive_price:.2f}/hr")
+            lines.append(
+                f"   💵 Save {best.savings_percent:.1f}% (${best.savings_amount:.2f}/hr)"
+            )
+
+        lines.append("=" * 80)
+        logger.info("\n".join(lines))
     
     async def run(self):
         """Main run loop"""
         self.running = True
         refresh_interval = self.config.get('refresh_interval_seconds', 60)
         
-        print("\n" + "="*80)
-        print("🚀 GP4U - The Kayak of GPUs")
-        print("="*80)
-        print("GPU Brokerage Platform - Compare • Deploy • Save")
-        print(f"Refresh Interval: {refresh_interval} seconds")
-        print("="*80 + "\n")
-        
+        logger.info(
+            "\n".join([
+                "",
+                "=" * 80,
+                "🚀 GP4U - The Kayak of GPUs",
+                "=" * 80,
+                "GPU Brokerage Platform - Compare • Deploy • Save",
+                f"Refresh Interval: {refresh_interval} seconds",
+                "=" * 80,
+            ])
+        )
+
         cycle_count = 0
-        
+
         try:
             while self.running:
                 cycle_count += 1
-                print(f"\n{'#'*80}")
-                print(f"CYCLE {cycle_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"{'#'*80}")
+                logger.info(
+                    f"CYCLE {cycle_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                )
                 
                 await self.run_refresh_cycle()
                 
@@ -162,29 +178,26 @@ class GP4UEngine:
     
     def _shutdown(self):
         """Clean shutdown"""
-        print("\n" + "="*80)
-        print("📊 FINAL SUMMARY")
-        print("="*80)
-        
         stats = self.db.get_dashboard_stats()
-        print(f"\nTotal Listings Tracked: {stats['total_listings']}")
-        print(f"Average Price: ${stats['avg_price']:.2f}/hr")
-        print(f"Cheapest GPU: ${stats['cheapest_gpu']:.2f}/hr")
-        print(f"Arbitrage Opportunities: {stats['arbitrage_opportunities']}")
+        lines = [
+            "",
+            "=" * 80,
+            "📊 FINAL SUMMARY",
+            "=" * 80,
+            f"Total Listings Tracked: {stats['total_listings']}",
+            f"Average Price: ${stats['avg_price']:.2f}/hr",
+            f"Cheapest GPU: ${stats['cheapest_gpu']:.2f}/hr",
+            f"Arbitrage Opportunities: {stats['arbitrage_opportunities']}",
+        ]
         if stats['best_arbitrage_percent'] > 0:
-            print(f"Best Arbitrage: {stats['best_arbitrage_percent']:.1f}% savings")
-        
-        print("\n" + "="*80)
-        print("🛑 GP4U Engine stopped")
-        print("="*80)
+            lines.append(f"Best Arbitrage: {stats['best_arbitrage_percent']:.1f}% savings")
+        lines.extend(["=" * 80, "🛑 GP4U Engine stopped"])
+        logger.info("\n".join(lines))
 
 async def main():
     """Main entry point"""
-    print("\n🚀 GP4U - The Kayak of GPUs")
-    print("="*80)
-    print("Compare GPU prices across Render, Akash, io.net, Vast.ai")
-    print("="*80)
-    
+    logger.info("🚀 GP4U - Compare GPU prices across Render, Akash, io.net, Vast.ai")
+
     engine = GP4UEngine('config.json')
     await engine.run()
 
@@ -56,7 +56,7 @@ class NetworkIntegration:
         provider_fee = base_price * (provider_fee_pct / 100)
         gp4u_fee = base_price * (self.broker_fee / 100)
         total = base_price + provider_fee + gp4u_fee
-        
+
         return {
             'base_price': base_price,
             'provider_fee': provider_fee,
@@ -64,6 +64,60 @@ class NetworkIntegration:
             'total_price': total
         }
 
+    def _build_listings(
+        self,
+        provider_label: str,
+        gpu_models: List[str],
+        locations: List[str],
+        count: int,
+        price_jitter: tuple,
+        uptime_range: tuple,
+        availability=None,
+    ) -> List[GPUListing]:
+        """
+        Generate a batch of mock listings in one pass
+
+        Config lookups and the fee fractions are hoisted out of the
+        per-listing loop, so the batch cost is the random draws plus the
+        dataclass constructions rather than repeated dict traversal and
+        fee-dict allocation per GPU.
+        """
+        gpu_specs = self.config.get('gpu_specs', {})
+        commission = self.network_config.get('commission_percent', 20.0) / 100
+        broker = self.broker_fee / 100
+        jitter_lo, jitter_hi = price_jitter
+        up_lo, up_hi = uptime_range
+
+        # Draw the whole batch of models/locations in two C-level calls
+        # instead of two random.choice invocations per listing
+        models = random.choices(gpu_models, k=count)
+        locs = random.choices(locations, k=count)
+
+        listings = []
+        for model, location in zip(models, locs):
+            specs = gpu_specs.get(model, {})
+            base_price = (
+                specs.get('base_price_per_hour', 2.0)
+                * random.uniform(jitter_lo, jitter_hi)
+            )
+            provider_fee = base_price * commission
+            gp4u_fee = base_price * broker
+
+            listings.append(GPUListing(
+                provider=provider_label,
+                gpu_model=model.replace('_', ' ').upper(),
+                vram_gb=specs.get('vram_gb', 24),
+                price_per_hour=base_price,
+                location=location,
+                availability=availability() if availability else 'Available',
+                uptime_percent=random.uniform(up_lo, up_hi),
+                provider_fee=provider_fee,
+                gp4u_fee=gp4u_fee,
+                total_price=base_price + provider_fee + gp4u_fee,
+            ))
+
+        return listings
+
 class RenderNetworkIntegration(NetworkIntegration):
     """Render Network integration"""
     
@@ -74,39 +128,16 @@ class RenderNetworkIntegration(NetworkIntegration):
         """Fetch GPUs from Render Network"""
         if not self.enabled:
             return []
-            
+
         # Simulate API call with mock data
-        gpu_models = ['rtx_4090', 'rtx_3090', 'a100', 'h100']
-        locations = ['US-East', 'US-West', 'EU-Central', 'Asia-Pacific']
-        gpus = []
-        
-        gpu_specs = self.config.get('gpu_specs', {})
-        
-        for _ in range(random.randint(3, 6)):
-            model = random.choice(gpu_models)
-            specs = gpu_specs.get(model, {})
-            base_price = specs.get('base_price_per_hour', 2.0)
-            
-            # Add some variance
-            base_price *= random.uniform(0.85, 1.15)
-            
-            pricing = self.calculate_total_price(base_price)
-            
-            gpu = GPUListing(
-                provider='Render',
-                gpu_model=model.replace('_', ' ').upper(),
-                vram_gb=specs.get('vram_gb', 24),
-                price_per_hour=base_price,
-                location=random.choice(locations),
-                availability='Available',
-                uptime_percent=random.uniform(95, 99.9),
-                provider_fee=pricing['provider_fee'],
-                gp4u_fee=pricing['gp4u_fee'],
-                total_price=pricing['total_price']
-            )
-            gpus.append(gpu)
-            
-        return gpus
+        return self._build_listings(
+            'Render',
+            ['rtx_4090', 'rtx_3090', 'a100', 'h100'],
+            ['US-East', 'US-West', 'EU-Central', 'Asia-Pacific'],
+            count=random.randint(3, 6),
+            price_jitter=(0.85, 1.15),
+            uptime_range=(95, 99.9),
+        )
 
 class AkashNetworkIntegration(NetworkIntegration):
     """Akash Network integration"""
@@ -118,38 +149,16 @@ class AkashNetworkIntegration(NetworkIntegration):
         """Fetch GPUs from Akash Network"""
         if not self.enabled:
             return []
-            
-        gpu_models = ['rtx_3090', 'a100', 'v100', 'a6000']
-        locations = ['US-East', 'EU-West', 'Asia']
-        gpus = []
-        
-        gpu_specs = self.config.get('gpu_specs', {})
-        
-        for _ in range(random.randint(4, 8)):
-            model = random.choice(gpu_models)
-            specs = gpu_specs.get(model, {})
-            base_price = specs.get('base_price_per_hour', 2.0)
-            
-            # Akash tends to be cheaper
-            base_price *= random.uniform(0.75, 1.05)
-            
-            pricing = self.calculate_total_price(base_price)
-            
-            gpu = GPUListing(
-                provider='Akash',
-                gpu_model=model.replace('_', ' ').upper(),
-                vram_gb=specs.get('vram_gb', 24),
-                price_per_hour=base_price,
-                location=random.choice(locations),
-                availability='Available',
-                uptime_percent=random.uniform(92, 98),
-                provider_fee=pricing['provider_fee'],
-                gp4u_fee=pricing['gp4u_fee'],
-                total_price=pricing['total_price']
-            )
-            gpus.append(gpu)
-            
-        return gpus
+
+        # Akash tends to be cheaper
+        return self._build_listings(
+            'Akash',
+            ['rtx_3090', 'a100', 'v100', 'a6000'],
+            ['US-East', 'EU-West', 'Asia'],
+            count=random.randint(4, 8),
+            price_jitter=(0.75, 1.05),
+            uptime_range=(92, 98),
+        )
 
 class IoNetIntegration(NetworkIntegration):
     """io.net integration"""
@@ -161,38 +170,15 @@ class IoNetIntegration(NetworkIntegration):
         """Fetch GPUs from io.net"""
         if not self.enabled:
             return []
-            
-        gpu_models = ['rtx_4090', 'h100', 'a100']
-        locations = ['US-Central', 'EU-North', 'Singapore']
-        gpus = []
-        
-        gpu_specs = self.config.get('gpu_specs', {})
-        
-        for _ in range(random.randint(2, 5)):
-            model = random.choice(gpu_models)
-            specs = gpu_specs.get(model, {})
-            base_price = specs.get('base_price_per_hour', 2.0)
-            
-            # io.net pricing
-            base_price *= random.uniform(0.9, 1.2)
-            
-            pricing = self.calculate_total_price(base_price)
-            
-            gpu = GPUListing(
-                provider='io.net',
-                gpu_model=model.replace('_', ' ').upper(),
-                vram_gb=specs.get('vram_gb', 24),
-                price_per_hour=base_price,
-                location=random.choice(locations),
-                availability='Available',
-                uptime_percent=random.uniform(94, 99),
-                provider_fee=pricing['provider_fee'],
-                gp4u_fee=pricing['gp4u_fee'],
-                total_price=pricing['total_price']
-            )
-            gpus.append(gpu)
-            
-        return gpus
+
+        return self._build_listings(
+            'io.net',
+            ['rtx_4090', 'h100', 'a100'],
+            ['US-Central', 'EU-North', 'Singapore'],
+            count=random.randint(2, 5),
+            price_jitter=(0.9, 1.2),
+            uptime_range=(94, 99),
+        )
 
 class VastAIIntegration(NetworkIntegration):
     """Vast.ai integration"""
@@ -204,38 +190,17 @@ class VastAIIntegration(NetworkIntegration):
         """Fetch GPUs from Vast.ai"""
         if not self.enabled:
             return []
-            
-        gpu_models = ['rtx_3090', 'rtx_4090', 'a100', 'v100', 'a6000']
-        locations = ['US-East', 'US-West', 'Canada', 'EU-Central']
-        gpus = []
-        
-        gpu_specs = self.config.get('gpu_specs', {})
-        
-        for _ in range(random.randint(5, 10)):
-            model = random.choice(gpu_models)
-            specs = gpu_specs.get(model, {})
-            base_price = specs.get('base_price_per_hour', 2.0)
-            
-            # Vast.ai has wide price ranges
-            base_price *= random.uniform(0.7, 1.4)
-            
-            pricing = self.calculate_total_price(base_price)
-            
-            gpu = GPUListing(
-                provider='Vast.ai',
-                gpu_model=model.replace('_', ' ').upper(),
-                vram_gb=specs.get('vram_gb', 24),
-                price_per_hour=base_price,
-                location=random.choice(locations),
-                availability='Available' if random.random() > 0.2 else 'Reserved',
-                uptime_percent=random.uniform(90, 99),
-                provider_fee=pricing['provider_fee'],
-                gp4u_fee=pricing['gp4u_fee'],
-                total_price=pricing['total_price']
-            )
-            gpus.append(gpu)
-            
-        return gpus
+
+        # Vast.ai has wide price ranges and occasional reserved slots
+        return self._build_listings(
+            'Vast.ai',
+            ['rtx_3090', 'rtx_4090', 'a100', 'v100', 'a6000'],
+            ['US-East', 'US-West', 'Canada', 'EU-Central'],
+            count=random.randint(5, 10),
+            price_jitter=(0.7, 1.4),
+            uptime_range=(90, 99),
+            availability=lambda: 'Available' if random.random() > 0.2 else 'Reserved',
+        )
 
 class GP4UNetworkAggregator:
     """Aggregates GPU listings from all networks"""